@@ -1,21 +1,53 @@
 from __future__ import annotations
 import csv
+import hashlib
+import logging
+import os
+import pickle
 from collections import namedtuple
+from importlib.metadata import version
 from pathlib import Path
 
+# The tables and the names of their namedtuples
+# periodictable.csv
+#   Source: https://gist.github.com/GoodmanSciences/c2dd862cd38f21b0ad36b8f96b4bf1ee
+# isotopestable.csv
+#   reference: http://moltensalt.org/references/static/downloads/pdf/stable-isotopes.pdf
+# enthalpytable.csv
+#   reference: https://cccbdb.nist.gov/hf0k.asp
+_table_sources = {
+    "periodic_table": ("periodictable.csv", "Element"),
+    "isotopes_table": ("isotopestable.csv", "Isotope"),
+    "enthalpy_table": ("enthalpytable.csv", "Enthalpy"),
+}
+# reference: http://udfa.ajmarkwick.net/downloads/RATE12_binding_energies.dist.txt
+_binding_energy_source = "rate12_binding_energy.dat"
+
+# The tables are loaded at the first access of these names (see `__getattr__`)
+_lazy_names = [
+    *_table_sources,
+    "rate12_binding_energy",
+    "element_index",
+    "element_position",
+    "enthalpy_index",
+]
+
+# increased when the format of the cache file is changed
+_cache_version = 2
 
-def _read_csv_table(filename: str, name: str) -> list:
+
+def _read_csv_table(filename: str) -> tuple[list[str], list[tuple[str]]]:
     path = Path(__file__).parent
     with open(path / filename, newline="") as inp:
         reader = csv.reader(filter(lambda row: row[0] != "#", inp))
-        item = namedtuple(name, next(reader))
-        table = list(map(item._make, reader))
-    return table
+        fields = next(reader)
+        rows = [tuple(row) for row in reader]
+    return fields, rows
 
 
 def _read_binding_energy() -> dict[str, int]:
     path = Path(__file__).parent
-    with open(path / "rate12_binding_energy.dat", newline="") as inp:
+    with open(path / _binding_energy_source, newline="") as inp:
         binding_energy = {}
         for line in inp.readlines():
             if not line.startswith("#"):
@@ -24,15 +56,126 @@ def _read_binding_energy() -> dict[str, int]:
     return binding_energy
 
 
-# Load the periodic table as a list of namedtuple
-# Source: https://gist.github.com/GoodmanSciences/c2dd862cd38f21b0ad36b8f96b4bf1ee
-periodic_table = _read_csv_table("periodictable.csv", "Element")
-# reference: http://moltensalt.org/references/static/downloads/pdf/stable-isotopes.pdf
-isotopes_table = _read_csv_table("isotopestable.csv", "Isotope")
-# reference: https://cccbdb.nist.gov/hf0k.asp
-enthalpy_table = _read_csv_table("enthalpytable.csv", "Enthalpy")
-# reference: http://udfa.ajmarkwick.net/downloads/RATE12_binding_energies.dist.txt
-rate12_binding_energy = _read_binding_energy()
+def _read_sources() -> dict:
+    """
+    Read the data files into builtin containers, which are stored in the cache
+
+    Returns:
+        dict: the fields and rows of the tables, the binding energies, and the
+            enthalpies indexed by species names
+    """
+    tables = {name: _read_csv_table(src) for name, (src, _) in _table_sources.items()}
+    fields, rows = tables["enthalpy_table"]
+    species, enthalpy = fields.index("Species"), fields.index("Enthalpy")
+    return {
+        "tables": tables,
+        "rate12_binding_energy": _read_binding_energy(),
+        "enthalpy_index": {row[species]: float(row[enthalpy]) for row in rows},
+    }
+
+
+def _cache_key() -> bytes:
+    """
+    The key of the cache, a hash of the package version and the data files.
+    The cache is regenerated if it was created by another version or from
+    different files.
+
+    Returns:
+        bytes: the hexadecimal digest
+    """
+    path = Path(__file__).parent
+    sources = [src for src, _ in _table_sources.values()] + [_binding_energy_source]
+    digest = hashlib.sha256(version("naunet").encode())
+    for src in sources:
+        digest.update(src.encode())
+        digest.update((path / src).read_bytes())
+    return digest.hexdigest().encode()
+
+
+def cache_path() -> Path:
+    """
+    The path of the binary cache of the tables, in `$XDG_CACHE_HOME/naunet`
+    (`~/.cache/naunet` by default)
+
+    Returns:
+        Path: path of the cache file
+    """
+    cachedir = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cachedir) / "naunet" / f"chemistrydata-v{_cache_version}.pickle"
+
+
+def _load_sources() -> dict:
+    """
+    Load the data from the cache if it matches the package version and the
+    current data files. Otherwise read the data files and rewrite the cache.
+
+    The cache file starts with the key (see `_cache_key`) and the digest of
+    the pickled data in two lines. The data are unpickled only if both match.
+
+    Returns:
+        dict: the data returned by `_read_sources`
+    """
+    path = cache_path()
+    key = _cache_key()
+
+    try:
+        with open(path, "rb") as inp:
+            cachekey = inp.readline().rstrip(b"\n")
+            checksum = inp.readline().rstrip(b"\n")
+            payload = inp.read()
+        if cachekey == key and hashlib.sha256(payload).hexdigest().encode() == checksum:
+            return pickle.loads(payload)
+    except Exception:
+        # regenerate the cache if it cannot be read
+        pass
+
+    data = _read_sources()
+
+    # the cache is optional, e.g. the home directory can be read-only
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmppath = path.with_suffix(f".{os.getpid()}.tmp")
+        payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        with open(tmppath, "wb") as outf:
+            outf.write(key + b"\n")
+            outf.write(hashlib.sha256(payload).hexdigest().encode() + b"\n")
+            outf.write(payload)
+        os.replace(tmppath, path)
+    except OSError as e:
+        logging.debug(f"Cannot write the cache of chemistry data: {e}")
+
+    return data
+
+
+def _load_tables() -> None:
+    """Load the tables and their indexes into the module namespace"""
+    data = _load_sources()
+
+    namespace = globals()
+    for name, (_, itemname) in _table_sources.items():
+        fields, rows = data["tables"][name]
+        item = namedtuple(itemname, fields)
+        namespace[name] = list(map(item._make, rows))
+
+    namespace["rate12_binding_energy"] = data["rate12_binding_energy"]
+
+    # Indexes of the tables by symbols of elements/isotopes and species names
+    elements = namespace["periodic_table"] + namespace["isotopes_table"]
+    namespace["element_index"] = {e.Symbol: e for e in elements}
+    namespace["element_position"] = {e.Symbol: i for i, e in enumerate(elements)}
+    namespace["enthalpy_index"] = data["enthalpy_index"]
+
+
+def __getattr__(name: str):
+    if name in _lazy_names:
+        _load_tables()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_lazy_names})
+
 
 user_binding_energy = {}
 
@@ -40,14 +183,30 @@ user_photon_yield = {}
 
 user_enthalpy = {}
 
+# increased when the user data are updated, used to invalidate cached values
+_revision = 0
+
+
+def revision() -> int:
+    """The number of updates of the user data"""
+    return _revision
+
+
+def _update_revision():
+    global _revision
+    _revision += 1
+
 
 def update_binding_energy(eb: dict[str, float]):
     user_binding_energy.update(eb)
+    _update_revision()
 
 
 def update_photon_yield(phyield: dict[str, float]):
     user_photon_yield.update(phyield)
+    _update_revision()
 
 
 def update_enthalpy(enthalpy: dict[str, float]):
     user_enthalpy.update(enthalpy)
+    _update_revision()
@@ -1,7 +1,8 @@
 from __future__ import annotations
 import logging
 from collections import OrderedDict
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import astuple, dataclass
 from enum import Enum
 from types import SimpleNamespace
 from .species import Species
@@ -12,22 +13,150 @@ class VariableType(Enum):
     param = 2
     derived = 3
 
+    # members are singletons, hashed by identity to look up symbol tables fast
+    __hash__ = object.__hash__
 
-@dataclass
+
+@dataclass(frozen=True)
 class Variable:
     symbol: str
     value: str | float | None
     type: VariableType
 
 
+class SymbolTable(OrderedDict):
+    """
+    Ordered table of the symbols registered by components. A table is shared
+    by all components which registered the same symbols in the same order,
+    and it is never modified after creation. Registering or unregistering a
+    symbol returns another (cached) table instead.
+
+    Attributes:
+        cache_size (int): The maximum number of derived tables kept by the
+            cache of `set` and `delete`. The least recently used ones are
+            dropped.
+    """
+
+    cache_size = 4096
+
+    # derived tables by (id of the table, change), see `_derive`
+    _transitions = OrderedDict()
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._views = {}
+
+    def __reduce__(self):
+        # pickled as the registered variables, and shared again when loaded
+        variables = [(name, astuple(var)) for name, var in self.items()]
+        return _restore_symbol_table, (variables,)
+
+    def set(
+        self, name: str, variable: tuple[str, str | float | None, VariableType]
+    ) -> SymbolTable:
+        """
+        Get the table with the symbol `name` added or replaced
+
+        Args:
+            name (str): name of the symbol
+            variable (tuple): symbol, value, and type of the variable
+
+        Returns:
+            SymbolTable: the new table
+        """
+        return self._derive(
+            ("set", name, *variable),
+            lambda table: table.update({name: Variable(*variable)}),
+        )
+
+    def delete(self, name: str) -> SymbolTable:
+        """
+        Get the table with the symbol `name` removed
+
+        Args:
+            name (str): name of the symbol
+
+        Raises:
+            KeyError: if the symbol is not in the table
+
+        Returns:
+            SymbolTable: the new table
+        """
+        if name not in self:
+            raise KeyError(name)
+
+        return self._derive(("delete", name), lambda table: table.pop(name))
+
+    def _derive(
+        self, change: tuple, apply: Callable[[SymbolTable], None]
+    ) -> SymbolTable:
+        """
+        Get the table derived from this one by `change`. The derived tables are
+        cached (holding this table alive), and the least recently used ones are
+        dropped if the cache exceeds `cache_size`.
+
+        Args:
+            change (tuple): the key of the change
+            apply (Callable[[SymbolTable], None]): applies the change to a copy
+
+        Returns:
+            SymbolTable: the derived table
+        """
+        transitions = SymbolTable._transitions
+        key = (id(self), *change)
+        cached = transitions.get(key)
+        if cached is not None:
+            transitions.move_to_end(key)
+            return cached[1]
+
+        table = SymbolTable(self)
+        apply(table)
+        transitions[key] = (self, table)
+        while len(transitions) > self.cache_size:
+            transitions.popitem(last=False)
+        return table
+
+    def view(self, vtype: VariableType) -> OrderedDict[str, str | float | None]:
+        """
+        The values of a type of variables indexed by their symbols. The result
+        is created once per table and shared, so it is copied by `Component`
+        before returned to the callers.
+
+        Args:
+            vtype (VariableType): type of the variables
+
+        Returns:
+            OrderedDict: symbols and values, in the order of registration
+        """
+        view = self._views.get(vtype)
+        if view is None:
+            view = self._views[vtype] = OrderedDict(
+                (var.symbol, var.value) for var in self.values() if var.type == vtype
+            )
+        return view
+
+
+def _restore_symbol_table(variables: list[tuple[str, tuple]]) -> SymbolTable:
+    table = Component._empty_symbols
+    for name, variable in variables:
+        table = table.set(name, variable)
+    return table
+
+
 class Component:
+    __slots__ = ("_symbols",)
+
+    # The table without any symbol, all tables are derived from it
+    _empty_symbols = SymbolTable()
+
     def __init__(self) -> None:
-        self._symbols = OrderedDict()
+        self._symbols = self._empty_symbols
 
     def _create_species(self, species_name: Species | str, **kwargs) -> Species:
         """
         Create a Species instance if the name is not a pseudo element
-        (e.g. CR, CRPHOT), else return None
+        (e.g. CR, CRPHOT), else return None. The instances are interned and
+        shared by all components using the same name and symbols.
 
         Args:
             species_name (Species | str): name of species
@@ -40,12 +169,12 @@ class Component:
             return species_name
 
         if species_name and species_name not in Species.known_pseudoelements():
-            return Species(species_name, **kwargs)
+            return Species.intern(species_name, **kwargs)
 
         return None
 
     def unregister(self, name: str) -> None:
-        del self._symbols[name]
+        self._symbols = self._symbols.delete(name)
 
     def register(
         self,
@@ -54,7 +183,7 @@ class Component:
         force_overwrite=False,
     ) -> None:
         if self._symbols.get(name) is None or force_overwrite:
-            self._symbols[name] = Variable(*variable)
+            self._symbols = self._symbols.set(name, variable)
 
         else:
             logging.warning(
@@ -64,10 +193,7 @@ class Component:
 
     @property
     def constants(self) -> dict[str, float]:
-        symbols = [
-            sym for _, sym in self._symbols.items() if sym.type == VariableType.constant
-        ]
-        return {sym.symbol: sym.value for sym in symbols}
+        return dict(self._symbols.view(VariableType.constant))
 
     @property
     def symbols(self) -> SimpleNamespace:
@@ -75,14 +201,8 @@ class Component:
 
     @property
     def params(self) -> dict[str, float]:
-        symbols = [
-            sym for _, sym in self._symbols.items() if sym.type == VariableType.param
-        ]
-        return {sym.symbol: sym.value for sym in symbols}
+        return dict(self._symbols.view(VariableType.param))
 
     @property
     def deriveds(self) -> OrderedDict[str, str]:
-        symbols = [
-            sym for _, sym in self._symbols.items() if sym.type == VariableType.derived
-        ]
-        return OrderedDict((sym.symbol, sym.value) for sym in symbols)
+        return OrderedDict(self._symbols.view(VariableType.derived))
@@ -95,14 +95,14 @@ class ExtendCommand(Command):
             remove_index = set()
             for spec in remove_species:
                 remove_index.update(net.where_species(spec))
-            net.remove_reaction(list(remove_index))
+            net.remove_reaction(remove_index)
 
         if self.option("remove-duplicate"):
             _, dupidx, _ = net.find_duplicate_reaction()
             net.remove_reaction(dupidx)
 
         initializer = supported_reaction_class.get(informat, Reaction)
-        kept_reactions = [reac.react_string for reac in net.reaction_list]
+        kept_reactions = {reac.react_string for reac in net.reaction_list}
         with open(f"dropped_reactions.{informat}", "w") as outf:
             with open(f"{inp}") as inpf:
                 for line in inpf.readlines():
@@ -95,14 +95,20 @@ class RenderCommand(Command):
         from naunet.network import Network, supported_reaction_class
         from naunet.chemistrydata import update_binding_energy, update_photon_yield
 
-        Species._replacement = replacement
+        Species.set_replacement(replacement)
         Species.set_known_elements(element)
         Species.set_known_pseudoelements(pseudo_element)
         binding = {
-            Species(key, **species_kwargs).name: value for key, value in binding.items()
+            spec.name: value
+            for spec, value in zip(
+                Species.from_names(binding, **species_kwargs), binding.values()
+            )
         }
         yields = {
-            Species(key, **species_kwargs).name: value for key, value in yields.items()
+            spec.name: value
+            for spec, value in zip(
+                Species.from_names(yields, **species_kwargs), yields.values()
+            )
         }
 
         update_binding_energy(binding)
@@ -1,20 +1,24 @@
 from __future__ import annotations
 import logging
 import os
+import pickle
 import shutil
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 from typing import Type
 from tqdm import tqdm
 from .templateloader import TemplateLoader
-from .species import Species
+from .species import Composition, ElementContext, Species
 from .reactions import Reaction, builtin_reaction_format
+from .reactions.table import ReactionTable
 from .reactions.converter import ExpressionConverter
 from .reactiontype import ReactionType
 from .grains import Grain, builtin_grain_model
 from .thermalprocess import ThermalProcess, get_allowed_cooling, get_allowed_heating
 from .configuration import NetworkConfiguration
 
-
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger()
 
@@ -51,6 +55,29 @@ def _reaction_factory(react_string: str, format: str) -> Reaction:
     return None
 
 
+def _read_reaction_tables(
+    rclass: type[Reaction], filename: str | Path
+) -> list[ReactionTable]:
+    """Read a file in chunks in a worker process of `add_reaction_from_files`"""
+    return list(rclass.read_tables(filename))
+
+
+def _can_read_in_worker(rclass: type[Reaction]) -> bool:
+    """
+    Whether a file of the format is worth and safe to read in a worker process.
+    The format needs a bulk reader, otherwise the tables only hold the lines,
+    and the class must be pickled by reference so that spawned workers can
+    import it.
+    """
+    if rclass.read_table.__func__ is Reaction.read_table.__func__:
+        return False
+    try:
+        pickle.dumps(rclass)
+    except Exception:
+        return False
+    return True
+
+
 def define_reaction(name: str):
     """
     Decorator for users to add customized reaction class
@@ -109,7 +136,12 @@ class Network:
            ```
 
     Attributes:
-        reaction_list (list[Reaction]): the reactions in the network
+        reaction_list (list[Reaction]): the reactions in the network, see
+            `reaction_list`
+
+    The species of the network are parsed with its own `ElementContext` if
+    `elements` or `pseudo_elements` are provided, else with the context active
+    when the network is created.
 
     """
 
@@ -131,27 +163,49 @@ class Network:
         grain_model: str = "",
         rate_modifier: dict[int, str] = None,
         ode_modifier: dict[str, dict[str, list[str | list[str]]]] = None,
+        workers: int = 1,
     ) -> None:
-        self.reaction_list = []
+        self._reaction_list = []
         self._reactants = set()
         self._products = set()
         self._skipped_reactions = []
 
+        # increased when the reactions or species are changed, the caches and
+        # indexes are valid only for the revision they are created at
+        self._revision = 0
+        self._composition = None
+        # the ordered species and their positions, see `_sort_species`
+        self._species = None
+        # indices of reactions by species, see `_index_species`
+        self._species_reactions = None
+        # indices of reactions by keys in each mode, see `_index_reactions`
+        self._reaction_index = {}
+
         # TODO: rename to known_elements and known_pseudoelements
         self._known_elements = elements or []
         self._known_pseudo_elements = pseudo_elements or []
 
+        self._element_context = ElementContext.current()
         if self._known_elements or self._known_pseudo_elements:
-            Species.set_known_elements(self._known_elements)
-            Species.set_known_pseudoelements(self._known_pseudo_elements)
+            self._element_context = ElementContext(
+                self._known_elements,
+                self._known_pseudo_elements,
+                self._element_context.replacement,
+            )
 
         allowed_species = allowed_species or []
         required_species = required_species or []
         species_kwargs = species_kwargs or {}
-        self._allowed_species = [Species(s, **species_kwargs) for s in allowed_species]
-        self._required_species = [
-            Species(s, **species_kwargs) for s in required_species
-        ]
+        context = self._element_context
+        self._allowed_species = Species.from_names(
+            allowed_species, **species_kwargs, context=context
+        )
+        self._required_species = Species.from_names(
+            required_species, **species_kwargs, context=context
+        )
+        # hashed copies of the allowed / required species for membership tests
+        self._allowed_species_set = set(self._allowed_species)
+        self._required_species_set = set(self._required_species)
         self._species_kwargs = species_kwargs.copy()
         self._allowed_heating = None
         self._allowed_cooling = None
@@ -164,7 +218,9 @@ class Network:
 
         if self._allowed_species and self._required_species:
             conflict = [
-                sp for sp in self._required_species if sp not in self._allowed_species
+                sp
+                for sp in self._required_species
+                if sp not in self._allowed_species_set
             ]
 
             if conflict:
@@ -191,14 +247,21 @@ class Network:
                         "Sizes of input files and sources are mismatching."
                     )
                 else:
-                    for fname, fmt in zip(filelist, fileformats):
-                        if fname and fmt:
-                            self.add_reaction_from_file(fname, fmt)
+                    files = [
+                        (fname, fmt)
+                        for fname, fmt in zip(filelist, fileformats)
+                        if fname and fmt
+                    ]
+                    self.add_reaction_from_files(
+                        [fname for fname, _ in files],
+                        [fmt for _, fmt in files],
+                        workers=workers,
+                    )
 
             elif isinstance(fileformats, str):
-                for fname in filelist:
-                    if fname and fileformats:
-                        self.add_reaction_from_file(fname, fileformats)
+                files = [fname for fname in filelist if fname and fileformats]
+                formats = [fileformats] * len(files)
+                self.add_reaction_from_files(files, formats, workers=workers)
 
             else:
                 raise RuntimeError(f"Unknown format: {fileformats}")
@@ -232,7 +295,9 @@ class Network:
     def __contains__(self, reac: Reaction) -> bool:
         if not isinstance(reac, Reaction):
             return NotImplemented
-        return reac in self.reaction_list
+        reactions = self.reaction_list
+        candidates = self._index_reactions().get(reac.rpkey, [])
+        return any(reactions[idx] == reac for idx in candidates)
 
     def _add_reaction(
         self, reaction: Reaction | tuple[str, str]
@@ -244,17 +309,15 @@ class Network:
         if not reaction:
             return set(), set(), None
 
-        if self._allowed_species:
-            if not all(
-                [
-                    rp in self._allowed_species
-                    for rp in reaction.reactants + reaction.products
-                ]
-            ):
+        allowed = self._allowed_species_set
+        if allowed:
+            if not all(rp in allowed for rp in reaction.reactants + reaction.products):
                 self._skipped_reactions.append(reaction)
                 return set(), set(), None
 
-        self.reaction_list.append(reaction)
+        self._reaction_list.append(reaction)
+        self._revision += 1
+        self._extend_indexes(len(self._reaction_list) - 1, reaction)
         new_reactants = set(reaction.reactants).difference(self._reactants)
         new_products = set(reaction.products).difference(self._products)
         self._reactants.update(new_reactants)
@@ -275,10 +338,6 @@ class Network:
                 instance from reaction string.
         """
 
-        if self._known_elements or self._known_pseudo_elements:
-            Species.set_known_elements(self._known_elements)
-            Species.set_known_pseudoelements(self._known_pseudo_elements)
-
         format = reaction.format if isinstance(reaction, Reaction) else reaction[1]
 
         rclass = supported_reaction_class.get(format)
@@ -290,7 +349,8 @@ class Network:
             else:
                 raise RuntimeError(f"Unknown format: {format}")
 
-        new_reactants, new_products, reactinst = self._add_reaction(reaction)
+        with self._element_context.activate():
+            new_reactants, new_products, reactinst = self._add_reaction(reaction)
         if new_reactants:
             logger.info(f"New reactants are added: {new_reactants}")
         if new_products:
@@ -300,7 +360,8 @@ class Network:
             rclass.finalize()
 
     def add_reaction_from_file(self, filename: str | Path, format: str) -> None:
-        """Add reactions into network from file
+        """Add reactions into network from file. The file is read lazily in
+        chunks, and can be compressed by gzip, bzip2, or xz.
 
         Args:
             filename (str | Path): the file to be read
@@ -310,31 +371,102 @@ class Network:
             RuntimeError: if the format is unknown
         """
 
-        if self._known_elements or self._known_pseudo_elements:
-            Species.set_known_elements(self._known_elements)
-            Species.set_known_pseudoelements(self._known_pseudo_elements)
+        rclass = supported_reaction_class.get(format)
+        if not rclass:
+            raise RuntimeError(f"Unknown format: {format}")
+
+        self._add_reaction_tables(rclass, rclass.read_tables(filename))
+
+    def add_reaction_from_files(
+        self,
+        filelist: list[str | Path],
+        fileformats: list[str],
+        workers: int = 1,
+    ) -> None:
+        """Add reactions into network from files. The files can be parsed
+        concurrently by worker processes, and the reactions are added in the
+        order of the files.
+
+        The workers read the files in chunks with `Reaction.read_tables` and
+        return the parsed columns, the reactions are created from them in this
+        process. Files in formats without a bulk reader, or whose reaction
+        class cannot be pickled (e.g. defined in a function), are read here.
+        The workers may be spawned instead of forked (the default on macOS and
+        Windows), so scripts using them need an `if __name__ == "__main__":`
+        guard.
+
+        Args:
+            filelist (list[str | Path]): the files to be read
+            fileformats (list[str]): the formats of the files
+            workers (int, optional): the number of processes parsing the files.
+                Defaults to 1, i.e. the files are parsed one by one.
+
+        Raises:
+            RuntimeError: if a format is unknown
+        """
+
+        rclasses = []
+        for format in fileformats:
+            rclass = supported_reaction_class.get(format)
+            if not rclass:
+                raise RuntimeError(f"Unknown format: {format}")
+            rclasses.append(rclass)
+
+        parallel = [_can_read_in_worker(rclass) for rclass in rclasses]
+        if workers <= 1 or sum(parallel) <= 1:
+            for filename, rclass in zip(filelist, rclasses):
+                self._add_reaction_tables(rclass, rclass.read_tables(filename))
+            return
+
+        # the reactions are created here with the species known by this process
+        with ProcessPoolExecutor(max_workers=min(workers, sum(parallel))) as pool:
+            results = [
+                pool.submit(_read_reaction_tables, rclass, filename) if p else None
+                for filename, rclass, p in zip(filelist, rclasses, parallel)
+            ]
+            for filename, rclass, result in zip(filelist, rclasses, results):
+                if result is None:
+                    tables = rclass.read_tables(filename)
+                else:
+                    tables = result.result()
+                self._add_reaction_tables(rclass, tables)
+
+    def _add_reaction_tables(
+        self, rclass: type[Reaction], tables: Iterable[ReactionTable]
+    ) -> None:
+        """Add the reactions in the tables read by `Reaction.read_tables`. The
+        progress is updated once per table.
+
+        Args:
+            rclass (type[Reaction]): the reaction class of the format
+            tables (Iterable[ReactionTable]): the tables of reactions in order
+        """
 
         new_reactants = set()
         new_products = set()
 
         # change some global settings or class attibutes if needed
-        rclass = supported_reaction_class.get(format)
-        if rclass:
-            rclass.initialize()
-        else:
-            raise RuntimeError(f"Unknown format: {format}")
-
-        with open(filename, "r") as networkfile:
-            for ln, line in enumerate(
-                tqdm(networkfile.readlines(), desc="Reading File...")
-            ):
-                try:
-                    reac, prod, reactinst = self._add_reaction((line, format))
-                    new_reactants.update(reac)
-                    new_products.update(prod)
-                except Exception as e:
-                    logger.error(f"Get error in line {ln}: {line}")
-                    raise e
+        rclass.initialize()
+
+        progress = tqdm(desc="Reading File...", unit=" lines")
+        with self._element_context.activate(), progress:
+            offset = 0
+            for table in tables:
+                for ln in range(len(table)):
+                    try:
+                        reaction = table[ln]
+                        if reaction is None:
+                            continue
+                        reac, prod, reactinst = self._add_reaction(reaction)
+                        new_reactants.update(reac)
+                        new_products.update(prod)
+                    except Exception as e:
+                        logger.error(
+                            f"Get error in line {offset + ln}: {table.lines[ln]}"
+                        )
+                        raise e
+                offset += len(table)
+                progress.update(len(table))
 
         rclass.finalize()
 
@@ -348,11 +480,10 @@ class Network:
             dict[str, ThermalProcess]: allowed cooling processes.
             Dictionary of {name: <cooling process>}
         """
-        speclist = sorted(
-            self._reactants | self._products | set(self._required_species)
-        )
+        speclist = sorted(self._reactants | self._products | self._required_species_set)
 
-        self._allowed_cooling = get_allowed_cooling(speclist)
+        with self._element_context.activate():
+            self._allowed_cooling = get_allowed_cooling(speclist)
         return self._allowed_cooling
 
     @property
@@ -365,11 +496,10 @@ class Network:
             dict[str, ThermalProcess]: allowed heating processes.
                                        Dictionary of {name: <heating process>}
         """
-        speclist = sorted(
-            self._reactants | self._products | set(self._required_species)
-        )
+        speclist = sorted(self._reactants | self._products | self._required_species_set)
 
-        self._allowed_heating = get_allowed_heating(speclist)
+        with self._element_context.activate():
+            self._allowed_heating = get_allowed_heating(speclist)
         return self._allowed_heating
 
     @property
@@ -385,21 +515,41 @@ class Network:
 
     @allowed_species.setter
     def allowed_species(self, speclist: list[str]):
-        if self._known_elements or self._known_pseudo_elements:
-            Species.set_known_elements(self._known_elements)
-            Species.set_known_pseudoelements(self._known_pseudo_elements)
-
-        self._allowed_species = [Species(s, **self._species_kwargs) for s in speclist]
+        self._allowed_species = Species.from_names(
+            speclist, **self._species_kwargs, context=self._element_context
+        )
+        self._allowed_species_set = allowed = set(self._allowed_species)
 
         # examine all reactions again
         recorded_reactions = self.reaction_list + self._skipped_reactions
         self._reactants.clear()
         self._products.clear()
-        self.reaction_list = []
+        self._reaction_list = []
+        self._revision += 1
         self._skipped_reactions = []
 
+        # filter the reactions in one pass without logging the new species
         for reaction in recorded_reactions:
-            self.add_reaction(reaction)
+            species = reaction.reactants + reaction.products
+            if not allowed or all(spec in allowed for spec in species):
+                self._reaction_list.append(reaction)
+                self._reactants.update(reaction.reactants)
+                self._products.update(reaction.products)
+            else:
+                self._skipped_reactions.append(reaction)
+
+    @property
+    def composition(self) -> Composition:
+        """
+        The element composition of the species in the network, in the order of
+        `species`. It is cached until the reactions or species are changed.
+
+        Returns:
+            Composition: the composition of species
+        """
+        if self._composition is None or self._composition[0] != self._revision:
+            self._composition = (self._revision, Composition(self.species))
+        return self._composition[1]
 
     @property
     def cooling(self) -> list[ThermalProcess]:
@@ -411,6 +561,14 @@ class Network:
         """
         return [self.allowed_cooling.get(c) for c in self._cooling_names]
 
+    @property
+    def element_context(self) -> ElementContext:
+        """
+        The known elements, pseudo-elements and replacements used to parse the
+        species in the network
+        """
+        return self._element_context
+
     @property
     def elements(self) -> list[Species]:
         """
@@ -420,7 +578,7 @@ class Network:
         Returns:
             list[Species]: list of elemental species
         """
-        return [spec for spec in self.species if spec.is_atom]
+        return [spec for spec in self.composition.species if spec.is_atom]
 
     def export(
         self,
@@ -546,8 +704,9 @@ class Network:
             tuple[set[Species], set[Species]]: the tuple of (source, sink), source and
                 sink are set of Species
         """
-        source = self._reactants.difference(self._products)
-        sink = self._products.difference(self._reactants)
+        byreactant, byproduct = self._index_species()
+        source = {spec for spec in byreactant if spec not in byproduct}
+        sink = {spec for spec in byproduct if spec not in byreactant}
 
         return source, sink
 
@@ -665,38 +824,117 @@ class Network:
         for idx, reac in enumerate(self.reaction_list):
             reac.idxfromfile = idx
 
-    def remove_reaction(self, reaction: int | Reaction | list[int | Reaction]) -> None:
+        # the formatted reactions can include the indices
+        self._reaction_index = {}
+
+    def remove_reaction(
+        self,
+        reaction: (
+            int
+            | Reaction
+            | Iterable[int]
+            | Iterable[bool]
+            | Iterable[Reaction]
+            | Callable[[Reaction], bool]
+        ),
+    ) -> list[Reaction]:
         """
-        Remove one or multiple reaction.
+        Remove one or multiple reaction. Multiple reactions are removed in one
+        pass over the network.
 
         Args:
-            reaction (int | Reaction | list[int] | list[Reaction]): the reactions to be
-                removed or their indices of reactions in the network
+            reaction (int | Reaction | Iterable[int] | Iterable[bool] |
+                Iterable[Reaction] | Callable[[Reaction], bool]): the reactions
+                to be removed, their indices in the network, a mask of the
+                reactions in the network, or a function returning True for the
+                reactions to be removed
 
         Raises:
-            TypeError: if the argument is not the type of int | Reaction or
-                list[int | Reaction]
+            TypeError: if the argument is not one of the types above
+            ValueError: if the size of the mask mismatches the reactions
+
+        Returns:
+            list[Reaction]: the removed reactions
         """
 
-        if isinstance(reaction, int):
-            self.reaction_list.pop(reaction)
+        reactions = self.reaction_list
+
+        if hasattr(reaction, "tolist"):
+            # e.g. NumPy arrays of indices or masks
+            reaction = reaction.tolist()
 
-        elif isinstance(reaction, list) and all(isinstance(r, int) for r in reaction):
-            self.reaction_list = [
-                r for idx, r in enumerate(self.reaction_list) if idx not in reaction
-            ]
+        if isinstance(reaction, int) and not isinstance(reaction, bool):
+            removed = [reactions.pop(reaction)]
+            mask = None
 
         elif isinstance(reaction, Reaction):
-            self.reaction_list = [r for r in self.reaction_list if r != reaction]
+            mask = [r == reaction for r in reactions]
 
-        elif isinstance(reaction, list) and all(
-            isinstance(r, Reaction) for r in reaction
-        ):
-            self.reaction_list = [r for r in self.reaction_list if r not in reaction]
+        elif callable(reaction):
+            mask = [bool(reaction(r)) for r in reactions]
+
+        elif isinstance(reaction, Iterable):
+            reaction = list(reaction)
+
+            if reaction and all(isinstance(r, bool) for r in reaction):
+                if len(reaction) != len(reactions):
+                    raise ValueError(
+                        f"Size of the mask ({len(reaction)}) mismatches the number "
+                        f"of reactions ({len(reactions)})"
+                    )
+                mask = reaction
+
+            elif all(isinstance(r, int) for r in reaction):
+                indices = set(reaction)
+                mask = [idx in indices for idx in range(len(reactions))]
+
+            elif all(isinstance(r, Reaction) for r in reaction):
+                # equal reactions have the same reactants and products
+                candidates = {}
+                for r in reaction:
+                    candidates.setdefault(r.rpkey, []).append(r)
+                mask = [
+                    any(r == c for c in candidates.get(r.rpkey, [])) for r in reactions
+                ]
+
+            else:
+                raise TypeError
 
         else:
             raise TypeError
 
+        if mask is not None:
+            removed = [r for r, rm in zip(reactions, mask) if rm]
+            self._reaction_list = [r for r, rm in zip(reactions, mask) if not rm]
+
+        # the species only in the removed reactions are dropped
+        self._reactants.clear()
+        self._products.clear()
+        for reac in self.reaction_list:
+            self._reactants.update(reac.reactants)
+            self._products.update(reac.products)
+
+        self._revision += 1
+
+        return removed
+
+    @property
+    def reaction_list(self) -> list[Reaction]:
+        """
+        The reactions in the network. Change them by `add_reaction`,
+        `remove_reaction`, or by assigning a new list. The caches and indexes
+        of the network are not updated if the list is changed in place.
+
+        Returns:
+            list[Reaction]: the reactions
+        """
+        return self._reaction_list
+
+    @reaction_list.setter
+    def reaction_list(self, reactions: Iterable[Reaction]):
+        self._reaction_list = list(reactions)
+        self._revision += 1
+
     @property
     def required_species(self) -> list[str]:
         """
@@ -710,11 +948,11 @@ class Network:
 
     @required_species.setter
     def required_species(self, speclist: list[str]):
-        if self._known_elements or self._known_pseudo_elements:
-            Species.set_known_elements(self._known_elements)
-            Species.set_known_pseudoelements(self._known_pseudo_elements)
-
-        self._required_species = [Species(s, **self._species_kwargs) for s in speclist]
+        self._required_species = Species.from_names(
+            speclist, **self._species_kwargs, context=self._element_context
+        )
+        self._required_species_set = set(self._required_species)
+        self._revision += 1
 
     @property
     def shielding(self) -> dict[str, str]:
@@ -728,15 +966,39 @@ class Network:
     def species(self) -> list[Species]:
         """
         Species exists in the network, including the species found from
-        reactions and the required species.
+        reactions and the required species. The order is cached until the
+        reactions or species are changed.
 
         Returns:
             list[Species]: species in the network
         """
+        speclist, _ = self._sort_species()
+        return list(speclist)
 
-        speclist = sorted(
-            self._reactants | self._products | set(self._required_species)
-        )
+    @property
+    def species_index(self) -> Mapping[Species, int]:
+        """
+        The position of each species in `species`
+
+        Returns:
+            Mapping[Species, int]: positions by species
+        """
+        _, index = self._sort_species()
+        return index
+
+    def _sort_species(self) -> tuple[list[Species], Mapping[Species, int]]:
+        """
+        Sort the species by the number of connected species and then by names.
+        The result is cached until the reactions or species are changed.
+
+        Returns:
+            tuple[list[Species], Mapping[Species, int]]: the sorted species and
+                their positions
+        """
+        if self._species is not None and self._species[0] == self._revision:
+            return self._species[1:]
+
+        speclist = sorted(self._reactants | self._products | self._required_species_set)
 
         connection = {sp: set() for sp in speclist}
         for reac in self.reaction_list:
@@ -745,8 +1007,10 @@ class Network:
                 connection[rp].update(reacrp)
 
         speclist = sorted(speclist, key=lambda x: (len(connection[x]), x))
+        index = MappingProxyType({spec: pos for pos, spec in enumerate(speclist)})
 
-        return speclist
+        self._species = (self._revision, speclist, index)
+        return speclist, index
 
     def to_code(
         self,
@@ -771,21 +1035,104 @@ class Network:
         """
 
         indices = []
+        reactions = self.reaction_list
 
         if mode is None:
+            # equal reactions have the same reactants and products
             indices = [
-                idx for idx, reac in enumerate(self.reaction_list) if reac == reaction
+                idx
+                for idx in self._index_reactions().get(reaction.rpkey, [])
+                if reactions[idx] == reaction
             ]
 
         else:
-            indices = [
-                idx
-                for idx, reac in enumerate(self.reaction_list)
-                if f"{reac:{mode}}" == f"{reaction:{mode}}"
-            ]
+            indices = list(self._index_reactions(mode).get(f"{reaction:{mode}}", []))
 
         return indices
 
+    def _index_reactions(self, mode: str = None) -> dict[Hashable, list[int]]:
+        """
+        The indices of reactions by their keys, which are `rpkey` if `mode` is
+        None, else the reactions formatted in the mode. The index of a mode is
+        built at the first use and updated as `_index_species`.
+
+        Args:
+            mode (str, optional): the format of the keys. Defaults to None.
+
+        Returns:
+            dict[Hashable, list[int]]: the indices of reactions by keys
+        """
+        index = self._reaction_index.get(mode)
+        # the revision of the indexed reactions and the indices
+        if index is None or index[0] != self._revision:
+            index = self._reaction_index[mode] = [self._revision, {}]
+            for idx, reac in enumerate(self._reaction_list):
+                self._add_reaction_index(index, idx, reac, mode)
+        return index[1]
+
+    @staticmethod
+    def _add_reaction_index(
+        index: list, idx: int, reaction: Reaction, mode: str = None
+    ) -> None:
+        """Add a reaction into an index of `_index_reactions`"""
+        key = reaction.rpkey if mode is None else f"{reaction:{mode}}"
+        index[1].setdefault(key, []).append(idx)
+
+    def _index_species(
+        self,
+    ) -> tuple[dict[Species, list[int]], dict[Species, list[int]]]:
+        """
+        The indices of reactions by the species in their reactants and in their
+        products. The index is built at the first use and extended with the
+        reactions added by `add_reaction` afterward. It is rebuilt if the
+        reactions are changed in other ways, e.g. by `remove_reaction`.
+
+        Returns:
+            tuple[dict[Species, list[int]], dict[Species, list[int]]]: the
+                indices of reactions by reactants and by products
+        """
+        index = self._species_reactions
+        # the revision of the indexed reactions and the indices
+        if index is None or index[0] != self._revision:
+            index = self._species_reactions = [self._revision, {}, {}]
+            for idx, reac in enumerate(self._reaction_list):
+                self._add_species_index(index, idx, reac)
+        return index[1], index[2]
+
+    @staticmethod
+    def _add_species_index(index: list, idx: int, reaction: Reaction) -> None:
+        """Add a reaction into the index of `_index_species`"""
+        _, byreactant, byproduct = index
+        for specs, byspec in [
+            (reaction.reactants, byreactant),
+            (reaction.products, byproduct),
+        ]:
+            for spec in specs:
+                indices = byspec.setdefault(spec, [])
+                # species can appear more than once in a reaction
+                if not indices or indices[-1] != idx:
+                    indices.append(idx)
+
+    def _extend_indexes(self, idx: int, reaction: Reaction) -> None:
+        """
+        Add a reaction appended to `reaction_list` into the indexes which were
+        up to date before it, the other indexes are rebuilt at their next use.
+
+        Args:
+            idx (int): the index of the reaction
+            reaction (Reaction): the appended reaction
+        """
+        revision = self._revision
+        index = self._species_reactions
+        if index is not None and index[0] == revision - 1:
+            index[0] = revision
+            self._add_species_index(index, idx, reaction)
+
+        for mode, index in self._reaction_index.items():
+            if index[0] == revision - 1:
+                index[0] = revision
+                self._add_reaction_index(index, idx, reaction, mode)
+
     def where_species(self, species: Species | str, mode: str = "all") -> list[int]:
         """
         Find the index of reactions involving the species. Use `mode` to select find
@@ -804,34 +1151,23 @@ class Network:
 
         indices = []
 
-        if self._known_elements or self._known_pseudo_elements:
-            Species.set_known_elements(self._known_elements)
-            Species.set_known_pseudoelements(self._known_pseudo_elements)
+        if not isinstance(species, Species):
+            species = Species(
+                species, **self._species_kwargs, context=self._element_context
+            )
 
-        species = (
-            species
-            if isinstance(species, Species)
-            else Species(species, **self._species_kwargs)
-        )
+        byreactant, byproduct = self._index_species()
 
         if mode == "reactant":
-            indices = [
-                idx
-                for idx, reac in enumerate(self.reaction_list)
-                if species in reac.reactants
-            ]
+            indices = list(byreactant.get(species, []))
 
         elif mode == "product":
-            indices = [
-                idx
-                for idx, reac in enumerate(self.reaction_list)
-                if species in reac.products
-            ]
+            indices = list(byproduct.get(species, []))
 
         elif mode == "all":
-            indices = [
-                idx for idx, reac in enumerate(self.reaction_list) if species in reac
-            ]
+            indices = sorted(
+                {*byreactant.get(species, []), *byproduct.get(species, [])}
+            )
 
         else:
             raise RuntimeError("Unknown mode: {mode}")
@@ -1,12 +1,11 @@
 from __future__ import annotations
 import logging
-from copy import copy
 from dataclasses import dataclass
 from jinja2 import Environment, PackageLoader, Template
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from .species import Species
+from .species import Composition, ElementContext, Species
 from .reactions import Reaction
 from .reactiontype import ReactionType
 from .templateloader import NetworkInfo
@@ -55,6 +54,7 @@ class Patch:
         derived_field_map = []
         derived_species_field = []
         species = info.species
+        composition = info.composition or Composition(species)
 
         for s in species:
             alias = "Electron" if s.is_electron else s.alias
@@ -78,7 +78,9 @@ class Patch:
 
         for ele in info.elements:
             specalias = ["Electron" if s.is_electron else s.alias for s in species]
-            specnatom = [s.element_count.get(ele.name, 0) for s in species]
+            specnatom = [0] * len(species)
+            for row, count in composition.column(ele.name):
+                specnatom[row] = count
             eleabund = [
                 f"{natom}*data['{alias}_ndensity']"
                 for natom, alias in zip(specnatom, specalias)
@@ -267,23 +269,35 @@ class EnzoPatch(Patch):
             network.cooling,
             network.grains,
             network.shielding,
+            network.composition,
         )
 
-        known_elements = Species.known_elements().copy()
-        Species.add_known_elements(list(Species._replacement.values()))
+        context = network.element_context
+        known_elements = context.elements.copy()
+        known_elements.extend(
+            e for e in context.replacement.values() if e not in known_elements
+        )
         for e in self._enzo_required_elements:
             if e not in known_elements:
-                Species.add_known_elements([e])
+                known_elements.append(e)
                 logging.info(
                     f"Temporarily add Enzo required element {e} "
                     "into known element list"
                 )
+        pseudoelements = [e for e in context.pseudoelements if e not in known_elements]
+        enzo_context = ElementContext(
+            known_elements, pseudoelements, context.replacement
+        )
 
         # duplicate the species in network and make them use the alias in enzo
-        species_network = [copy(s) for s in network.species]
+        with enzo_context.activate():
+            species_network = [
+                Species(s.name, s._grain_symbol, s._surface_prefix, s._bulk_prefix)
+                for s in network.species
+            ]
 
-        species_enzo = [Species(s) for s in EnzoPatch.enzo_defined_species_name]
-        species_grackle = [Species(s) for s in EnzoPatch.grackle_species_name]
+            species_enzo = [Species(s) for s in EnzoPatch.enzo_defined_species_name]
+            species_grackle = [Species(s) for s in EnzoPatch.grackle_species_name]
 
         for s, alias in zip(species_grackle, self.grackle_defined_alias):
             s.alias = alias
@@ -306,8 +320,6 @@ class EnzoPatch(Patch):
             species_diff_grackle,
         )
 
-        Species.set_known_elements(known_elements)
-
         templates = templates or self.templates
 
         for tmplname in templates:
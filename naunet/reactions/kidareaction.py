@@ -1,11 +1,17 @@
+from __future__ import annotations
 import logging
+from collections.abc import Iterable
 from enum import IntEnum
+from pathlib import Path
 from ..grains.grain import Grain
 from .reaction import Reaction
+from .table import ReactionTable, parse_columns, read_lines
 from ..reactiontype import ReactionType as BasicType
 
 
 class KIDAReaction(Reaction):
+    __slots__ = ("formula", "itype")
+
     format = "kida"
 
     class ReactionType(IntEnum):
@@ -26,12 +32,35 @@ class KIDAReaction(Reaction):
         6: ReactionType.KIDA_TB,
     }
 
-    def __init__(self, react_string: str) -> None:
+    # length of the string containing reactants / products
+    rlen = 34
+    plen = 56
+
+    # fields after the reactants and products
+    fields = [
+        ("alpha", float),
+        ("beta", float),
+        ("gamma", float),
+        (None, str),  # F
+        (None, str),  # g
+        (None, str),  # type of uncertainty
+        ("itype", int),
+        ("temp_min", float),
+        ("temp_max", float),
+        ("formula", int),
+        ("idxfromfile", int),
+        (None, str),  # number of temperature ranges
+        (None, str),  # recommendation
+    ]
+
+    def __init__(
+        self, react_string: str = None, formula: int = -1, itype: int = -1, **kwargs
+    ) -> None:
         # extra attributes in KIDAReaction
-        self.formula = -1
-        self.itype = -1
+        self.formula = formula
+        self.itype = itype
 
-        super().__init__(react_string=react_string)
+        super().__init__(react_string=react_string, **kwargs)
 
     def rateexpr(self, grain: Grain = None) -> str:
         a = self.alpha
@@ -70,22 +99,19 @@ class KIDAReaction(Reaction):
     def _parse_string(self, react_string) -> None:
         self.source = "kida"
 
-        react_string = react_string.strip()
+        react_string = react_string.strip() if react_string else ""
         if react_string != "":
-            rlen = 34  # length of the string containing reactants
-            plen = 56  # length of the string containing products
+            rlen = self.rlen
+            plen = self.plen
             # print(react_string[:rlen].split())
             # print(react_string[rlen : rlen + plen].split())
-            self.reactants = [
-                self._create_species(r)
-                for r in react_string[:rlen].split()
-                if self._create_species(r)
-            ]
-            self.products = [
+            reactants = [self._create_species(r) for r in react_string[:rlen].split()]
+            products = [
                 self._create_species(p)
                 for p in react_string[rlen : rlen + plen].split()
-                if self._create_species(p)
             ]
+            self.reactants = [s for s in reactants if s]
+            self.products = [s for s in products if s]
 
             a, b, c, _, _, _, itype, lt, ut, form, idx, _, _ = react_string[
                 rlen + plen :
@@ -99,9 +125,58 @@ class KIDAReaction(Reaction):
             self.temp_max = float(ut)
             self.formula = int(form)
             self.idxfromfile = int(idx)
-            if self.formula < 1 or self.formula > 6:
-                logging.warning(
-                    f"Formula {form} is not valid in reaction {self:short}, change to formula = 3."
-                )
-                self.formula = 3
-            self.reaction_type = self.formula2type.get(self.formula)
+            self._check_formula()
+
+    def _check_formula(self) -> None:
+        if self.formula < 1 or self.formula > 6:
+            logging.warning(
+                f"Formula {self.formula} is not valid in reaction {self:short}, change to formula = 3."
+            )
+            self.formula = 3
+        self.reaction_type = self.formula2type.get(self.formula)
+
+    @classmethod
+    def from_table(cls, table: ReactionTable, pos: int, line: str) -> KIDAReaction:
+        reaction = cls(
+            reactants=table.species(table.reactants[pos]),
+            products=table.species(table.products[pos]),
+            **table.row(pos),
+        )
+        reaction._check_formula()
+        reaction.react_string = line
+        return reaction
+
+    @classmethod
+    def read_table(cls, source: str | Path | Iterable[str]) -> ReactionTable:
+        """
+        Read the reactions in a KIDA file into columns. The species names are
+        split at the fixed widths of the reactants and products, and the
+        other fields are parsed at once.
+
+        Args:
+            source (str | Path | Iterable[str]): path of the file, or an opened
+                file / iterable of lines
+
+        Returns:
+            ReactionTable: the table of the reactions
+        """
+        lines = read_lines(source)
+        rlen, plen = cls.rlen, cls.plen
+
+        # the fields are sliced from the stripped lines as in `_parse_string`,
+        # and empty lines are created one by one
+        texts = [line.strip() for line in lines]
+        rows = [i for i, text in enumerate(texts) if text]
+        parsed, columns = parse_columns(
+            [texts[i][rlen + plen :] for i in rows], cls.fields
+        )
+        rows = [rows[i] for i in parsed]
+
+        return ReactionTable(
+            cls,
+            lines,
+            rows=rows,
+            reactants=[tuple(texts[i][:rlen].split()) for i in rows],
+            products=[tuple(texts[i][rlen : rlen + plen].split()) for i in rows],
+            columns=columns,
+        )
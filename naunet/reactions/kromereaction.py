@@ -1,31 +1,64 @@
+from __future__ import annotations
 import re
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from pathlib import Path
 from ..component import VariableType as vt
 from ..grains.grain import Grain
 from ..species import Species
 from .reaction import Reaction
 from .converter import ExpressionConverter
+from .table import ReactionTable, read_chunks, read_lines
 
 
 class KROMEReaction(Reaction):
+    __slots__ = ("kromeformat", "rate_string")
+
     format = "krome"
 
     _kromerateconverter = ExpressionConverter("Fortran")
 
-    def __init__(self, react_string: str) -> None:
+    # the format of reactions if there is no @format line
+    default_format = "idx,r,r,r,p,p,p,p,tmin,tmax,rate"
+
+    def __init__(
+        self,
+        react_string: str = None,
+        kromeformat: str = None,
+        commons: Iterable[str] = None,
+        variables: Iterable[str] = None,
+        rate_string: str = None,
+        **kwargs,
+    ) -> None:
+        """
+        Args:
+            react_string (str, optional): a reaction line. Defaults to None.
+            kromeformat (str, optional): the @format of the reaction. Defaults
+                to None, i.e. the format set by `preprocessing`.
+            commons (Iterable[str], optional): the @common variables. Defaults
+                to None, i.e. the variables set by `preprocessing`.
+            variables (Iterable[str], optional): the @var definitions. Defaults
+                to None, i.e. the definitions set by `preprocessing`.
+            rate_string (str, optional): the rate expression in Fortran.
+                Defaults to None.
+            **kwargs: arguments of `Reaction`
+        """
         # Extra attributes in KROMEReaction
-        self.kromeformat = self.reacformat.lower().strip()
-        self.rate_string = None
+        if kromeformat is None:
+            kromeformat = self.reacformat
+        self.kromeformat = kromeformat.lower().strip()
+        self.rate_string = rate_string
 
-        super().__init__(react_string=react_string)
+        super().__init__(react_string=react_string, **kwargs)
 
         self.unregister("dust_temperature")
         self.unregister("cosmic_ray_ionization_rate")
         self.unregister("visual_extinction")
         self.unregister("dust_grain_albedo")
 
-        for c in self._user_commons:
+        for c in self._user_commons if commons is None else commons:
             self.register(c, (c, None, vt.param), force_overwrite=True)
-        for v in self._user_vars:
+        for v in self._user_vars if variables is None else variables:
             lhs, rhs = v.split("=")
             self.register(
                 lhs.strip(),
@@ -42,65 +75,252 @@ class KROMEReaction(Reaction):
 
     @classmethod
     def initialize(cls) -> None:
-        cls.reacformat = "idx,r,r,r,p,p,p,p,tmin,tmax,rate"
+        cls.reacformat = cls.default_format
         cls._user_commons = []
         cls._user_vars = []
 
-    @classmethod
-    def preprocessing(cls, line: str) -> str:
+    @staticmethod
+    def _read_header(line: str, header: dict) -> bool:
+        """
+        Read the settings in a header line into `header`
+
+        Args:
+            line (str): a line in the file
+            header (dict): the "kromeformat", "commons", and "variables"
+
+        Returns:
+            bool: whether the line is a header or a comment
+        """
         if line.startswith(("#", "//")):
-            return ""
+            return True
         elif line.startswith("@format:"):
-            cls.reacformat = line.replace("@format:", "")
-            return ""
+            header["kromeformat"] = line.replace("@format:", "")
+            return True
         elif line.startswith("@var"):
             if "Hnuclei" not in line:
-                cls._user_vars.append(line.replace("@var:", "").strip())
-            return ""
+                header["variables"].append(line.replace("@var:", "").strip())
+            return True
         elif line.startswith("@common:"):
             commonlist = line.replace("@common:", "").strip().split(",")
-            cls._user_commons.extend(commonlist)
+            header["commons"].extend(commonlist)
+            return True
+        return False
+
+    @classmethod
+    def preprocessing(cls, line: str) -> str:
+        header = {
+            "kromeformat": cls.reacformat,
+            "commons": cls._user_commons,
+            "variables": cls._user_vars,
+        }
+        if cls._read_header(line, header):
+            cls.reacformat = header["kromeformat"]
             return ""
-        else:
-            return line.strip()
+        return line.strip()
 
-    def rateexpr(self, grain: Grain = None) -> str:
-        rate = re.sub(r"(\d\.?)d(\-?\d)", r"\1e\2", self.rate_string)
+    @classmethod
+    def from_table(cls, table: ReactionTable, pos: int, line: str) -> KROMEReaction:
+        header = table.columns["header"][pos]
+        fields = table.columns["fields"][pos]
+        if fields is None:
+            # e.g. raise the errors in the line as parsing it alone
+            return cls(react_string=line.strip(), **header)
+
+        reaction = cls(
+            reactants=table.species(table.reactants[pos]),
+            products=table.species(table.products[pos]),
+            **header,
+            **fields,
+        )
+        reaction.react_string = line.strip()
+        return reaction
+
+    @classmethod
+    def read_table(cls, source: str | Path | Iterable[str]) -> ReactionTable:
+        """
+        Read the reactions in a KROME file into columns. The header lines are
+        read once per section into the settings shared by the reactions below
+        them, so no class attribute is changed. Identical rate expressions are
+        stored once and converted once per header settings by `rateexpr`.
+
+        Args:
+            source (str | Path | Iterable[str]): path of the file, or an opened
+                file / iterable of lines
+
+        Returns:
+            ReactionTable: the table of the reactions
+        """
+        settings = {"kromeformat": cls.default_format, "commons": [], "variables": []}
+        return cls._read_lines(read_lines(source), settings, {})
+
+    @classmethod
+    def read_tables(
+        cls, source: str | Path | Iterable[str], chunksize: int = 10000
+    ) -> Iterator[ReactionTable]:
+        # the settings in the headers are kept across the chunks
+        settings = {"kromeformat": cls.default_format, "commons": [], "variables": []}
+        rates = {}
+        for lines in read_chunks(source, chunksize):
+            yield cls._read_lines(lines, settings, rates)
+
+    @classmethod
+    def _read_lines(
+        cls, lines: list[str], settings: dict, rates: dict[str, str]
+    ) -> ReactionTable:
+        """
+        Read the lines into a table, see `read_table`
+
+        Args:
+            lines (list[str]): the lines of the file
+            settings (dict): the settings of the headers, updated by the
+                headers in the lines
+            rates (dict[str, str]): the rate strings which have been read,
+                updated by the rate strings in the lines
+
+        Returns:
+            ReactionTable: the table of the reactions
+        """
+        header = None
+        rows, ignored = [], []
+        reactants, products, headers, fieldlist = [], [], [], []
+        for i, line in enumerate(lines):
+            react_string = line.strip()
+            if cls._read_header(line, settings):
+                # the reactions below the header have new settings
+                header = None
+                ignored.append(i)
+                continue
+            elif not react_string:
+                ignored.append(i)
+                continue
+
+            if header is None:
+                header = {
+                    "kromeformat": settings["kromeformat"].lower().strip(),
+                    "commons": tuple(settings["commons"]),
+                    "variables": tuple(settings["variables"]),
+                }
+                keys = header["kromeformat"].split(",")
+
+            rows.append(i)
+            headers.append(header)
+            fields = None
+            if not react_string.startswith("#"):
+                try:
+                    fields = cls._parse_fields(react_string, keys)
+                except ValueError:
+                    pass
+
+            if fields is None:
+                # created from the line as reading it alone, see `from_table`
+                reactants.append(None)
+                products.append(None)
+                fieldlist.append(None)
+                continue
+
+            reactants.append(tuple(fields.pop("reactants")))
+            products.append(tuple(fields.pop("products")))
+            if "rate_string" in fields:
+                rate = fields["rate_string"]
+                fields["rate_string"] = rates.setdefault(rate, rate)
+            fieldlist.append(fields)
+
+        return ReactionTable(
+            cls,
+            lines,
+            rows=rows,
+            reactants=reactants,
+            products=products,
+            columns={"header": headers, "fields": fieldlist},
+            ignored=ignored,
+        )
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _convert_rate(
+        cls,
+        rate_string: str,
+        params: tuple[str, ...] = (),
+        deriveds: tuple[tuple[str, str], ...] = (),
+    ) -> str:
+        """
+        Convert a rate expression in Fortran to C. The conversions are cached
+        by the rate string and the settings of the @common / @var headers.
+
+        Args:
+            rate_string (str): the rate expression in Fortran
+            params (tuple[str, ...], optional): names of the parameters.
+                Defaults to ().
+            deriveds (tuple[tuple[str, str], ...], optional): names and
+                expressions of the derived variables. Defaults to ().
+
+        Returns:
+            str: the rate expression in C
+        """
+        rate = re.sub(r"(\d\.?)d(\-?\d)", r"\1e\2", rate_string)
         rate = re.sub(r"(idx_.?)p", r"\1II", rate)
         rate = re.sub(r"(idx_.?)m", r"\1M", rate)
         rate = re.sub(r"(idx_.?)\)", r"\1I)", rate)
         rate = rate.replace("Hnuclei", "nH")
-        self._kromerateconverter.read(rate)
-        rate = f"{self._kromerateconverter:c}"
+        cls._kromerateconverter.read(rate)
+        rate = f"{cls._kromerateconverter:c}"
         return rate
 
+    def rateexpr(self, grain: Grain = None) -> str:
+        return self._convert_rate(
+            self.rate_string, tuple(self.params), tuple(self.deriveds.items())
+        )
+
+    @staticmethod
+    def _parse_fields(react_string: str, keys: list[str]) -> dict:
+        """
+        Parse the fields of a reaction line
+
+        Args:
+            react_string (str): the reaction line
+            keys (list[str]): the keys of the fields in @format
+
+        Raises:
+            ValueError: if a number cannot be parsed
+
+        Returns:
+            dict: names of reactants and products, and the values of other
+                attributes of the reaction
+        """
+        fields = {"reactants": [], "products": []}
+        for key, value in zip(keys, react_string.split(",")):
+            if value == "":
+                continue
+            elif key == "idx":
+                fields["idxfromfile"] = int(value)
+            elif key == "r":
+                fields["reactants"].append(value)
+            elif key == "p":
+                fields["products"].append(value)
+            elif key in ["tmin", "tmax"]:
+                if value.upper() not in ["N", "NONE", "N/A", "NO", ""]:
+                    for opstr in ["<", ">", ".LE.", ".GE.", ".LT.", ".GT."]:
+                        value = value.replace(opstr, "")
+                    value = value.replace("d", "e")
+                    fields["temp_min" if key == "tmin" else "temp_max"] = float(value)
+            elif key == "rate":
+                fields["rate_string"] = value.replace("dexp", "exp")
+        return fields
+
     def _parse_string(self, react_string) -> None:
         self.source = "krome"
 
-        react_string = react_string.strip()
+        react_string = react_string.strip() if react_string else ""
         if react_string != "" and react_string[0] != "#":
-            kwords = self.kromeformat.split(",")
-
-            for key, value in zip(kwords, react_string.split(",")):
-                if value == "":
-                    continue
-                elif key == "idx":
-                    self.idxfromfile = int(value)
-                elif key == "r" and self._create_species(value):
-                    self.reactants.append(self._create_species(value))
-                elif key == "p" and self._create_species(value):
-                    self.products.append(self._create_species(value))
-                elif key == "tmin":
-                    if value.upper() not in ["N", "NONE", "N/A", "NO", ""]:
-                        for opstr in ["<", ">", ".LE.", ".GE.", ".LT.", ".GT."]:
-                            value = value.replace(opstr, "")
-                        value = value.replace("d", "e")
-                        self.temp_min = float(value)
-                elif key == "tmax":
-                    if value.upper() not in ["N", "NONE", "N/A", "NO", ""]:
-                        for opstr in ["<", ">", ".LE.", ".GE.", ".LT.", ".GT."]:
-                            value = value.replace(opstr, "")
-                        value = value.replace("d", "e")
-                        self.temp_max = float(value)
-                elif key == "rate":
-                    self.rate_string = value.replace("dexp", "exp")
+            fields = self._parse_fields(react_string, self.kromeformat.split(","))
+
+            for name in fields.pop("reactants"):
+                species = self._create_species(name)
+                if species:
+                    self.reactants.append(species)
+            for name in fields.pop("products"):
+                species = self._create_species(name)
+                if species:
+                    self.products.append(species)
+            for key, value in fields.items():
+                setattr(self, key, value)
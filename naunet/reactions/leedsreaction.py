@@ -1,9 +1,13 @@
+from __future__ import annotations
 import logging
+from collections.abc import Iterable
 from enum import IntEnum
+from pathlib import Path
 from ..component import VariableType as vt
 from ..species import Species
 from ..grains.grain import Grain
 from .reaction import Reaction
+from .table import ReactionTable, fixed_width_splitter, read_lines
 from ..reactiontype import ReactionType as BasicType
 
 
@@ -14,6 +18,8 @@ class LEEDSReaction(Reaction):
     The name can be changed anytime
     """
 
+    __slots__ = ("rtype",)
+
     format = "leeds"
 
     class ReactionType(IntEnum):
@@ -66,11 +72,26 @@ class LEEDSReaction(Reaction):
         20: ReactionType.LEEDS_EC,
     }
 
-    def __init__(self, react_string: str) -> None:
+    # names, types, and widths of the fixed-width fields
+    layout = [
+        ("idxfromfile", int, 5),
+        ("reactants", str, 30),
+        ("products", str, 50),
+        ("alpha", float, 8),
+        ("beta", float, 9),
+        ("gamma", float, 10),
+        ("temp_min", float, 5),
+        ("temp_max", float, 5),
+        ("rtype", str, 3),
+    ]
+    # get the fields of a line at once
+    _split_fields = staticmethod(fixed_width_splitter([w for *_, w in layout]))
+
+    def __init__(self, react_string: str = None, rtype: int = None, **kwargs) -> None:
         # Extra attributes in LEEDSReaction
-        self.rtype = None
+        self.rtype = rtype
 
-        super().__init__(react_string=react_string)
+        super().__init__(react_string=react_string, **kwargs)
 
         self.register("ism_radiation_field", ("gism", 1.6e-3, vt.constant))
         self.register("ism_cosmic_ray_ionization_rate", ("zism", 1.3e-17, vt.constant))
@@ -219,69 +240,95 @@ class LEEDSReaction(Reaction):
     def _parse_string(self, react_string) -> None:
         self.source = "leeds"
 
-        list_label = [
-            "idx",
-            "reac",
-            "prod",
-            "a",
-            "b",
-            "c",
-            "lt",
-            "ht",
-            "type",
-        ]
-        list_strlen = [
-            5,
-            30,
-            50,
-            8,
-            9,
-            10,
-            5,
-            5,
-            3,
-        ]
         # react_string = react_string.strip()
-        if react_string.strip() != "":
-            stidx = 0
-            for label, len in zip(list_label, list_strlen):
-                clip = react_string[stidx : stidx + len]
-                if label == "idx":
-                    self.idxfromfile = int(clip)
-                elif label == "reac":
-                    reactants = [
-                        self._create_species(
-                            r.replace("YC", "CH2OHC"), surface_prefix="G"
-                        )
-                        for r in clip.split()
-                    ]
-                    # remove `None` values in the list
-                    self.reactants = [s for s in reactants if s]
-
-                elif label == "prod":
-                    products = [
-                        self._create_species(
-                            p.replace("YC", "CH2OHC"), surface_prefix="G"
-                        )
-                        for p in clip.split()
-                    ]
-                    # remove `None` values in the list
-                    self.products = [s for s in products if s]
-
-                elif label == "a":
-                    self.alpha = float(clip)
-                elif label == "b":
-                    self.beta = float(clip)
-                elif label == "c":
-                    self.gamma = float(clip)
-                elif label == "lt":
-                    self.temp_min = float(clip)
-                elif label == "ht":
-                    self.temp_max = float(clip)
-                elif label == "type":
-                    self.rtype = int(clip[1:])  # the first char is not used
-                    self.reaction_type = self.rtype2type.get(self.rtype)
-                else:
-                    raise RuntimeError("Unknown label inserted! Please check")
-
-                stidx += len
+        if react_string and react_string.strip() != "":
+            idx, reac, prod, a, b, c, lt, ht, rtype = self._split_fields(react_string)
+            self.idxfromfile = int(idx)
+
+            reactants = [
+                self._create_species(self._species_name(r), surface_prefix="G")
+                for r in reac.split()
+            ]
+            # remove `None` values in the list
+            self.reactants = [s for s in reactants if s]
+
+            products = [
+                self._create_species(self._species_name(p), surface_prefix="G")
+                for p in prod.split()
+            ]
+            # remove `None` values in the list
+            self.products = [s for s in products if s]
+
+            self.alpha = float(a)
+            self.beta = float(b)
+            self.gamma = float(c)
+            self.temp_min = float(lt)
+            self.temp_max = float(ht)
+            self.rtype = int(rtype[1:])  # the first char is not used
+            self.reaction_type = self.rtype2type.get(self.rtype)
+
+    @staticmethod
+    def _species_name(token: str) -> str:
+        return token.replace("YC", "CH2OHC")
+
+    @classmethod
+    def from_table(cls, table: ReactionTable, pos: int, line: str) -> LEEDSReaction:
+        reaction = cls(
+            reactants=table.species(table.reactants[pos], surface_prefix="G"),
+            products=table.species(table.products[pos], surface_prefix="G"),
+            **table.row(pos),
+        )
+        reaction.react_string = line
+        return reaction
+
+    @classmethod
+    def read_table(cls, source: str | Path | Iterable[str]) -> ReactionTable:
+        """
+        Read the reactions in a Leeds file into columns. The lines are cut by
+        the precompiled fixed-width layout, and the species names are
+        translated once per unique token.
+
+        Args:
+            source (str | Path | Iterable[str]): path of the file (can be
+                compressed, see `open_text`), or an opened file / iterable of lines
+
+        Returns:
+            ReactionTable: the table of the reactions
+        """
+        lines = read_lines(source)
+
+        # empty lines are created one by one as in `_parse_string`
+        rows = [i for i, line in enumerate(lines) if line.strip()]
+        fields = [cls._split_fields(lines[i]) for i in rows]
+
+        names = {}
+        reactants, products = [], []
+        for field in fields:
+            for col, column in [(1, reactants), (2, products)]:
+                tokens = field[col].split()
+                for tok in tokens:
+                    if tok not in names:
+                        names[tok] = cls._species_name(tok)
+                column.append(tuple(names[tok] for tok in tokens))
+
+        columns = {}
+        try:
+            for col, (name, typ, _) in enumerate(cls.layout):
+                if typ is not str:
+                    columns[name] = list(map(typ, (field[col] for field in fields)))
+            rtypes = [int(field[-1][1:]) for field in fields]
+        except ValueError:
+            # fall back to create all reactions line by line
+            return ReactionTable(cls, lines)
+
+        columns["rtype"] = rtypes
+        columns["reaction_type"] = list(map(cls.rtype2type.get, rtypes))
+
+        return ReactionTable(
+            cls,
+            lines,
+            rows=rows,
+            reactants=reactants,
+            products=products,
+            columns=columns,
+        )
@@ -1,17 +1,43 @@
 from __future__ import annotations
 from collections import Counter
+from collections.abc import Iterable, Iterator
+from pathlib import Path
 from ..component import Component, VariableType as vt
 from ..grains.grain import Grain
 from ..species import Species
 from ..reactiontype import ReactionType
 from ..utilities import _fill_list
+from .table import ReactionTable, read_chunks, read_lines
 
 
 class Reaction(Component):
-    """Class of chemical reactions"""
+    """
+    Class of chemical reactions
+
+    Reactions created when `Reaction.compact` (or the attribute of a
+    subclass) is True hold their reactants and products in tuples.
+    """
+
+    __slots__ = (
+        "_reactants",
+        "_products",
+        "_rpkey",
+        "temp_min",
+        "temp_max",
+        "alpha",
+        "beta",
+        "gamma",
+        "reaction_type",
+        "idxfromfile",
+        "source",
+        "_react_string",
+    )
 
     format = "naunet"
 
+    # create compact reactions to save memory
+    compact = False
+
     def __init__(
         self,
         reactants: list[Species] | list[str] = None,
@@ -27,16 +53,12 @@ class Reaction(Component):
     ) -> None:
         super().__init__()
 
-        self.reactants = (
-            [self._create_species(r) for r in reactants if self._create_species(r)]
-            if reactants
-            else []
-        )
-        self.products = (
-            [self._create_species(p) for p in products if self._create_species(p)]
-            if products
-            else []
-        )
+        self._rpkey = None
+        reactants = [self._create_species(r) for r in reactants or []]
+        products = [self._create_species(p) for p in products or []]
+        # remove `None` values in the list
+        self.reactants = [s for s in reactants if s]
+        self.products = [s for s in products if s]
         self.temp_min = temp_min
         self.temp_max = temp_max
         self.alpha = alpha
@@ -46,7 +68,7 @@ class Reaction(Component):
         self.idxfromfile = idxfromfile
         self.source = "unknown"
 
-        self.react_string = react_string
+        self._react_string = react_string
         # if react_string:
         self._parse_string(react_string)
 
@@ -58,6 +80,10 @@ class Reaction(Component):
         self.register("visual_extinction", ("Av", 1.0, vt.param))
         self.register("dust_grain_albedo", ("omega", 0.5, vt.param))
 
+        if self.compact:
+            self.reactants = tuple(self.reactants)
+            self.products = tuple(self.products)
+
     def __contains__(self, spec: Species) -> bool:
         if not isinstance(spec, Species):
             return NotImplemented
@@ -73,7 +99,7 @@ class Reaction(Component):
         # ? TODO: include the comparison of symbols
         # ignore reaction_type if there is no this information e.g. krome
         return (
-            self.rpeq(o)
+            self.rpkey == o.rpkey
             and self.temp_min == o.temp_min
             and self.temp_max == o.temp_max
             and (
@@ -194,7 +220,7 @@ class Reaction(Component):
         return verbose
 
     def __hash__(self) -> int:
-        return hash(tuple([*sorted(self.reactants), *sorted(self.products)]))
+        return hash(self.rpkey)
 
     def __repr__(self) -> str:
         params = ", ".join(
@@ -238,16 +264,10 @@ class Reaction(Component):
             return
 
         idx, *rps, a, b, c, lt, ut, rtype, source = react_string.split(",")
-        self.reactants = [
-            self._create_species(r.strip())
-            for r in rps[0:3]
-            if self._create_species(r.strip())
-        ]
-        self.products = [
-            self._create_species(p.strip())
-            for p in rps[3:8]
-            if self._create_species(p.strip())
-        ]
+        reactants = [self._create_species(r.strip()) for r in rps[0:3]]
+        products = [self._create_species(p.strip()) for p in rps[3:8]]
+        self.reactants = [s for s in reactants if s]
+        self.products = [s for s in products if s]
 
         self.alpha = float(a)
         self.beta = float(b)
@@ -258,6 +278,64 @@ class Reaction(Component):
         self.reaction_type = ReactionType(int(rtype))
         self.source = source
 
+    @property
+    def reactants(self) -> list[Species]:
+        return self._reactants
+
+    @reactants.setter
+    def reactants(self, reactants: list[Species]) -> None:
+        self._reactants = reactants
+        self._rpkey = None
+
+    @property
+    def products(self) -> list[Species]:
+        return self._products
+
+    @products.setter
+    def products(self, products: list[Species]) -> None:
+        self._products = products
+        self._rpkey = None
+
+    @property
+    def rpkey(self) -> tuple[tuple, tuple]:
+        """
+        The canonical key of the reactants and products, i.e. the sorted
+        identities of the species. It is created once and reset when the
+        reactants or products are reassigned (in-place changes of the lists are
+        not tracked).
+
+        Returns:
+            tuple[tuple, tuple]: the keys of the reactants and the products
+        """
+        if self._rpkey is None:
+            self._rpkey = (
+                tuple(sorted(s._key for s in self._reactants)),
+                tuple(sorted(s._key for s in self._products)),
+            )
+        return self._rpkey
+
+    @property
+    def key(self) -> tuple:
+        """
+        The canonical key of the reaction: the keys of the reactants and
+        products, the temperature range, and the reaction type
+
+        Returns:
+            tuple: (`rpkey`, temp_min, temp_max, reaction_type)
+        """
+        return (self.rpkey, self.temp_min, self.temp_max, self.reaction_type)
+
+    @property
+    def react_string(self) -> str:
+        """
+        The input string of the reaction, i.e. the line read from the file
+        """
+        return self._react_string
+
+    @react_string.setter
+    def react_string(self, react_string: str) -> None:
+        self._react_string = react_string
+
     @classmethod
     def initialize(cls) -> None:
         """
@@ -302,6 +380,63 @@ class Reaction(Component):
         else:
             return next(iter(groups)) if groups else None
 
+    @classmethod
+    def from_table(cls, table: ReactionTable, pos: int, line: str) -> Reaction:
+        """
+        Create a reaction from the columns parsed by `read_table`. Formats with
+        a bulk reader override it, the default creates the reaction from the
+        line in the same way as reading the file line by line.
+
+        Args:
+            table (ReactionTable): the table of reactions
+            pos (int): position of the reaction in the columns
+            line (str): the line of the reaction
+
+        Returns:
+            Reaction: the reaction, or None if the line is not a reaction
+        """
+        react_string = cls.preprocessing(line)
+        if react_string:
+            return cls(react_string=react_string)
+        return None
+
+    @classmethod
+    def read_table(cls, source: str | Path | Iterable[str]) -> ReactionTable:
+        """
+        Read the reactions in a file into a table. Formats with a bulk reader
+        parse the lines into columns, otherwise the reactions are created from
+        the lines when they are accessed.
+
+        Args:
+            source (str | Path | Iterable[str]): path of the file, or an opened
+                file / iterable of lines
+
+        Returns:
+            ReactionTable: the table of the reactions
+        """
+        return ReactionTable(cls, read_lines(source))
+
+    @classmethod
+    def read_tables(
+        cls, source: str | Path | Iterable[str], chunksize: int = 10000
+    ) -> Iterator[ReactionTable]:
+        """
+        Read the reactions in a file lazily into tables of `chunksize` lines,
+        see `read_table`. Only one chunk of the file is held at a time.
+
+        Args:
+            source (str | Path | Iterable[str]): path of the file (can be
+                compressed, see `open_text`), or an opened file / iterable of
+                lines
+            chunksize (int, optional): the number of lines in a table. Defaults
+                to 10000.
+
+        Yields:
+            Iterator[ReactionTable]: the tables of the reactions in order
+        """
+        for lines in read_chunks(source, chunksize):
+            yield cls.read_table(lines)
+
     @classmethod
     def preprocessing(cls, line: str) -> str:
         """
@@ -329,6 +464,9 @@ class Reaction(Component):
             reactions. Otherwise False
         """
 
+        if isinstance(o, Reaction):
+            return self.rpkey == o.rpkey
+
         return Counter(self.reactants) == Counter(o.reactants) and Counter(
             self.products
         ) == Counter(o.products)
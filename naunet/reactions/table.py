@@ -0,0 +1,303 @@
+from __future__ import annotations
+import bz2
+import gzip
+import lzma
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from itertools import accumulate, islice
+from operator import itemgetter
+from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
+from ..species import ElementContext, Species
+
+if TYPE_CHECKING:
+    from .reaction import Reaction
+
+
+# openers of the compressed files by the suffixes
+_compressed_openers = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+    ".lzma": lzma.open,
+}
+
+
+def open_text(filename: str | Path) -> TextIO:
+    """
+    Open a text file for reading, compressed files (*.gz, *.bz2, *.xz, and
+    *.lzma) are decompressed transparently
+
+    Args:
+        filename (str | Path): path of the file
+
+    Returns:
+        TextIO: the opened file
+    """
+    opener = _compressed_openers.get(Path(filename).suffix)
+    if opener:
+        return opener(filename, "rt")
+    return open(filename, "r")
+
+
+def read_lines(source: str | Path | Iterable[str]) -> list[str]:
+    """
+    Read the lines of a reaction file
+
+    Args:
+        source (str | Path | Iterable[str]): path of the file (can be
+            compressed, see `open_text`), or an opened file / iterable of lines
+
+    Returns:
+        list[str]: the lines including the line breaks
+    """
+    if isinstance(source, (str, Path)):
+        with open_text(source) as inp:
+            return inp.readlines()
+    return list(source)
+
+
+def read_chunks(
+    source: str | Path | Iterable[str], chunksize: int
+) -> Iterator[list[str]]:
+    """
+    Read the lines of a reaction file lazily in chunks
+
+    Args:
+        source (str | Path | Iterable[str]): path of the file (can be
+            compressed, see `open_text`), or an opened file / iterable of lines
+        chunksize (int): the number of lines in a chunk
+
+    Yields:
+        Iterator[list[str]]: the lines including the line breaks
+    """
+    if isinstance(source, (str, Path)):
+        with open_text(source) as inp:
+            yield from read_chunks(inp, chunksize)
+        return
+
+    lines = iter(source)
+    while True:
+        chunk = list(islice(lines, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def parse_columns(
+    texts: list[str],
+    fields: list[tuple[str | None, type]],
+    delimiter: str = None,
+    extra: bool = False,
+) -> tuple[list[int], dict[str, Sequence]]:
+    """
+    Parse delimited texts into typed columns. The texts are parsed at once by
+    NumPy if it is available. Texts not in the layout of `fields` (e.g. with
+    a different number of fields) are skipped.
+
+    Args:
+        texts (list[str]): the texts to be parsed
+        fields (list[tuple[str | None, type]]): names and types (float, int,
+            or str) of all fields in a text, the fields named None are not
+            stored. The str fields are not stripped.
+        delimiter (str, optional): the delimiter of fields. Defaults to None,
+            i.e. whitespaces.
+        extra (bool, optional): whether the texts can have more fields than
+            `fields`, which are ignored. Defaults to False.
+
+    Returns:
+        tuple[list[int], dict[str, Sequence]]: the indices of the parsed texts,
+            and the columns by names
+    """
+    names = [name for name, _ in fields]
+
+    try:
+        import numpy as np
+
+        # the unused fields are parsed as short strings
+        dtype = [
+            (f"_{i}", "U1") if name is None else (name, object if typ is str else typ)
+            for i, (name, typ) in enumerate(fields)
+        ]
+        # numpy skips empty texts, which are not expected here
+        if texts and all(text.strip() for text in texts):
+            data = np.loadtxt(
+                texts,
+                dtype=dtype,
+                delimiter=delimiter,
+                comments=None,
+                usecols=range(len(fields)) if extra else None,
+                ndmin=1,
+            )
+            rows = list(range(len(texts)))
+            return rows, {name: data[name] for name in names if name}
+    except (ImportError, ValueError):
+        pass
+
+    # parse the texts one by one
+    rows = []
+    values = []
+    for i, text in enumerate(texts):
+        tokens = text.rstrip("\r\n").split(delimiter)
+        if len(tokens) != len(fields) and not (extra and len(tokens) > len(fields)):
+            continue
+        try:
+            values.append(
+                [typ(tok) for tok, (name, typ) in zip(tokens, fields) if name]
+            )
+        except ValueError:
+            continue
+        rows.append(i)
+
+    columns = zip(*values) if values else ([] for _ in names)
+    columns = dict(zip([name for name in names if name], map(list, columns)))
+    return rows, columns
+
+
+def fixed_width_splitter(widths: list[int]) -> Callable[[str], tuple[str, ...]]:
+    """
+    Precompile a fixed-width layout
+
+    Args:
+        widths (list[int]): the widths of the fields
+
+    Returns:
+        Callable[[str], tuple[str, ...]]: function cutting a text into the
+            fields, which are empty if the text is too short
+    """
+    bounds = [0, *accumulate(widths)]
+    return itemgetter(*(slice(start, end) for start, end in zip(bounds, bounds[1:])))
+
+
+class ReactionTable(Sequence):
+    """
+    Reactions read in bulk from a file. The values of the reactions are stored
+    in columns (NumPy arrays if numpy is available) by the reader of the
+    format, and the Reaction instances are only created when the rows are
+    accessed.
+
+    Rows which are not parsed by the bulk reader (e.g. headers, comments, or
+    lines in an unexpected layout) are created from their lines in the same
+    way as reading the file line by line, unless the reader marks them as
+    ignored.
+    """
+
+    def __init__(
+        self,
+        rclass: type[Reaction],
+        lines: list[str],
+        rows: list[int] = None,
+        reactants: list[tuple[str, ...]] = None,
+        products: list[tuple[str, ...]] = None,
+        columns: dict[str, Sequence] = None,
+        ignored: Iterable[int] = None,
+    ) -> None:
+        """
+        Args:
+            rclass (type[Reaction]): the reaction class of the format
+            lines (list[str]): the lines of the file
+            rows (list[int], optional): the indices of the lines parsed into
+                columns. Defaults to None, i.e. no line is parsed.
+            reactants (list[tuple[str, ...]], optional): names of reactants of
+                the parsed lines. Defaults to None.
+            products (list[tuple[str, ...]], optional): names of products of the
+                parsed lines. Defaults to None.
+            columns (dict[str, Sequence], optional): values of the parsed lines
+                by names of the columns. Defaults to None.
+            ignored (Iterable[int], optional): the indices of the lines which
+                are not reactions, e.g. headers and comments. Defaults to None.
+        """
+        self.rclass = rclass
+        self.lines = lines
+        self.reactants = reactants or []
+        self.products = products or []
+        self.columns = columns or {}
+        # position of the lines in the columns
+        self._position = {line: pos for pos, line in enumerate(rows or [])}
+        self._ignored = set(ignored or [])
+        # columns as lists of builtin values, created at the first access
+        self._values = None
+        # species by names, created in the element context of the reactions
+        self._context = None
+        self._species = {}
+
+    def __getitem__(self, index: int) -> Reaction | None:
+        """
+        Create the reaction in a row
+
+        Args:
+            index (int): index of the line
+
+        Returns:
+            Reaction | None: the reaction, or None if the line is not a reaction
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        pos = self._position.get(index)
+        if pos is not None:
+            return self.rclass.from_table(self, pos, self.lines[index])
+        if index in self._ignored:
+            return None
+
+        react_string = self.rclass.preprocessing(self.lines[index])
+        if react_string:
+            return self.rclass(react_string=react_string)
+        return None
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    @property
+    def nparsed(self) -> int:
+        """The number of lines parsed into columns"""
+        return len(self._position)
+
+    def row(self, pos: int) -> dict[str, float | int | str]:
+        """
+        The values of a row in the columns
+
+        Args:
+            pos (int): position in the columns
+
+        Returns:
+            dict[str, float | int | str]: builtin values by names of the columns
+        """
+        if self._values is None:
+            self._values = {
+                name: col.tolist() if hasattr(col, "tolist") else list(col)
+                for name, col in self.columns.items()
+            }
+        return {name: col[pos] for name, col in self._values.items()}
+
+    def species(self, names: tuple[str, ...], **kwargs) -> list[Species]:
+        """
+        The species of the names, see `Component._create_species`. The species
+        are looked up once per name in the table.
+
+        Args:
+            names (tuple[str, ...]): names of species
+            **kwargs: arguments of `Species.intern`
+
+        Returns:
+            list[Species]: the species, None for pseudo elements
+        """
+        context = ElementContext.current()
+        if context is not self._context:
+            self._context = context
+            self._species = {}
+
+        cache = self._species.setdefault(tuple(sorted(kwargs.items())), {})
+        species = []
+        for name in names:
+            spec = cache.get(name, False)
+            if spec is False:
+                if name and name not in Species.known_pseudoelements():
+                    spec = Species.intern(name, **kwargs)
+                else:
+                    spec = None
+                cache[name] = spec
+            species.append(spec)
+        return species
@@ -10,6 +10,8 @@ class UCLCHEMReaction(Reaction):
     The reaction format of UCLCHEM Makerates output.
     """
 
+    __slots__ = ()
+
     format = "uclchem"
 
     class ReactionType(IntEnum):
@@ -179,12 +181,10 @@ class UCLCHEMReaction(Reaction):
             # self.temp_min = 10.0
             # self.temp_max = 41000.0
 
-            reactants = [r for r in rpspec[0:3] if r not in kwlist]
-            products = [p for p in rpspec[3:7] if p not in kwlist]
-
-            self.reactants = [
-                self._create_species(r) for r in reactants if self._create_species(r)
-            ]
-            self.products = [
-                self._create_species(p) for p in products if self._create_species(p)
+            reactants = [
+                self._create_species(r) for r in rpspec[0:3] if r not in kwlist
             ]
+            products = [self._create_species(p) for p in rpspec[3:7] if p not in kwlist]
+
+            self.reactants = [s for s in reactants if s]
+            self.products = [s for s in products if s]
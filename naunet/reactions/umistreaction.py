@@ -1,10 +1,16 @@
+from __future__ import annotations
+from collections.abc import Iterable
 from enum import IntEnum
+from pathlib import Path
 from ..grains.grain import Grain
 from .reaction import Reaction
+from .table import ReactionTable, parse_columns, read_lines
 from ..reactiontype import ReactionType as BasicType
 
 
 class UMISTReaction(Reaction):
+    __slots__ = ("code",)
+
     format = "umist"
 
     class ReactionType(IntEnum):
@@ -41,11 +47,26 @@ class UMISTReaction(Reaction):
         "RR": ReactionType.UMIST_RR,
     }
 
-    def __init__(self, react_string: str) -> None:
+    # the first 14 fields of a reaction, the others (e.g. references) are not
+    # used
+    fields = [
+        ("idxfromfile", int),
+        ("code", str),
+        *((f"reactant{i}", str) for i in range(2)),
+        *((f"product{i}", str) for i in range(4)),
+        (None, str),  # number of temperature ranges
+        ("alpha", float),
+        ("beta", float),
+        ("gamma", float),
+        ("temp_min", float),
+        ("temp_max", float),
+    ]
+
+    def __init__(self, react_string: str = None, code: str = None, **kwargs) -> None:
         # Extra attributes in UMISTReaction
-        self.code = None
+        self.code = code
 
-        super().__init__(react_string=react_string)
+        super().__init__(react_string=react_string, **kwargs)
 
     def rateexpr(self, grain: Grain = None) -> str:
         a = self.alpha
@@ -80,16 +101,14 @@ class UMISTReaction(Reaction):
     def _parse_string(self, react_string) -> None:
         self.source = "umist"
 
-        react_string = react_string.strip()
+        react_string = react_string.strip() if react_string else ""
         if react_string != "":
             idx, code, *rps, _, a, b, c, lt, ut = react_string.split(":")[:14]
             # print(id, rps)
-            self.reactants = [
-                self._create_species(r) for r in rps[0:2] if self._create_species(r)
-            ]
-            self.products = [
-                self._create_species(p) for p in rps[2:6] if self._create_species(p)
-            ]
+            reactants = [self._create_species(r) for r in rps[0:2]]
+            products = [self._create_species(p) for p in rps[2:6]]
+            self.reactants = [s for s in reactants if s]
+            self.products = [s for s in products if s]
 
             self.alpha = float(a)
             self.beta = float(b)
@@ -99,3 +118,49 @@ class UMISTReaction(Reaction):
             self.idxfromfile = int(idx)
             self.code = code
             self.reaction_type = self.code2type.get(self.code)
+
+    @classmethod
+    def from_table(cls, table: ReactionTable, pos: int, line: str) -> UMISTReaction:
+        reaction = cls(
+            reactants=table.species(table.reactants[pos]),
+            products=table.species(table.products[pos]),
+            **table.row(pos),
+        )
+        reaction.react_string = line
+        return reaction
+
+    @classmethod
+    def read_table(cls, source: str | Path | Iterable[str]) -> ReactionTable:
+        """
+        Read the reactions in a UMIST file into columns. The colon-delimited
+        fields of the whole file are parsed at once, and the codes are mapped
+        to the reaction types.
+
+        Args:
+            source (str | Path | Iterable[str]): path of the file (can be
+                compressed, see `open_text`), or an opened file / iterable of lines
+
+        Returns:
+            ReactionTable: the table of the reactions
+        """
+        lines = read_lines(source)
+
+        # empty lines are created one by one as in `_parse_string`
+        rows = [i for i, line in enumerate(lines) if line.strip()]
+        parsed, columns = parse_columns(
+            [lines[i].strip() for i in rows], cls.fields, delimiter=":", extra=True
+        )
+        rows = [rows[i] for i in parsed]
+
+        reactants = list(zip(*(columns.pop(f"reactant{i}") for i in range(2))))
+        products = list(zip(*(columns.pop(f"product{i}") for i in range(4))))
+        columns["reaction_type"] = [cls.code2type.get(c) for c in columns["code"]]
+
+        return ReactionTable(
+            cls,
+            lines,
+            rows=rows,
+            reactants=reactants,
+            products=products,
+            columns=columns,
+        )
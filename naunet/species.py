@@ -1,8 +1,37 @@
 from __future__ import annotations
 import logging
 import re
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from itertools import count
+from typing import TYPE_CHECKING, Iterable, Iterator
 from . import chemistrydata
 
+if TYPE_CHECKING:
+    import numpy as np
+
+# the element context activated by `ElementContext.activate`
+_active_context = ContextVar("element_context", default=None)
+
+# numbers the states of element contexts, see `ElementContext.clear`
+_context_generation = count()
+
+
+def _check_elements(elements: list[str], pseudoelements: list[str]) -> None:
+    """
+    Check whether repeated elements exist in the lists of elements and
+    pseudo-elements.
+    """
+    counts = Counter(elements + pseudoelements)
+    dup_element = [ele for ele in elements + pseudoelements if counts[ele] > 1]
+    if dup_element:
+        logging.error(
+            f"Repeated definitions of {dup_element} in elements and pseudoelemts"
+        )
+
 
 class Species:
     """
@@ -31,9 +60,48 @@ class Species:
             used to parse species names.
         element_count (dict[str, int]): The count of each element in the
             known species list.
+        registry_size (int): The maximum number of species kept by the
+            registry of interned species (see `intern`).
+
+    The known elements, pseudo-elements and replacements are taken from the
+    active `ElementContext`. The class methods below change the default
+    context, which is used when no other context is active.
+
+    Species are compared and hashed by an identity key computed when the
+    name is parsed. Changing `name` afterward does not update the key and the
+    derived names (e.g. `basename`, `gasname`).
+
+    Interned species (see `intern`) are shared by every reaction and network,
+    so their setters (e.g. `alias`, `binding_energy`) raise AttributeError.
+    Set the values on a copy (`copy.copy`) instead.
 
     """
 
+    __slots__ = (
+        "name",
+        "element_count",
+        "_alias",
+        "_binding_energy",
+        "_bulk_prefix",
+        "_cache",
+        "_cache_revision",
+        "_charge",
+        "_context",
+        "_enthalpy",
+        "_grain_group",
+        "_grain_symbol",
+        "_hash",
+        "_interned",
+        "_is_grain",
+        "_is_surface",
+        "_key",
+        "_mass",
+        "_massnumber",
+        "_photon_yield",
+        "_surface_group",
+        "_surface_prefix",
+    )
+
     default_elements = [
         "e",
         "E",
@@ -78,18 +146,24 @@ class Species:
     _known_pseudoelements = []
     _replacement = {}
 
+    # the maximum number of interned species in each element context
+    registry_size = 8192
+
     def __init__(
         self,
         name: str,
         grain_symbol: str = "GRAIN",
         surface_prefix: str = "#",
         bulk_prefix: str = "@",
+        context: ElementContext = None,
     ) -> None:
         """
         Initializes Species with species name
 
         Args:
             name (str): name of the species
+            context (ElementContext, optional): the elements used to parse the
+                name. Defaults to the active context.
         """
 
         if not isinstance(name, str):
@@ -100,8 +174,8 @@ class Species:
         self._alias = None
         self._binding_energy = None
         self._enthalpy = None
-        self._mass = 0.0
-        self._massnumber = 0
+        self._mass = None
+        self._massnumber = None
         self._photon_yield = None
         self._is_grain = False
         self._grain_symbol = grain_symbol
@@ -110,62 +184,38 @@ class Species:
         self._surface_prefix = surface_prefix
         self._surface_group = None
         self._bulk_prefix = bulk_prefix
+        self._cache = {}
+        self._cache_revision = None
+        self._interned = False
 
-        # Initialize known elements if not set when the fist species is instanciated
-        if not Species._known_elements and not Species._known_pseudoelements:
-            logging.warning("No assigned known element list. Use default elements")
-
-            Species._known_elements.extend(Species.default_elements)
-            Species._known_pseudoelements.extend(Species.default_pseudoelements)
+        self._context = context or ElementContext.current()
+        self._context.prepare()
+        self._parse_molecule_name([self._grain_symbol, self._surface_prefix])
 
-        self._parse_molecule_name(
-            Species._known_elements + Species._known_pseudoelements,
-            [self._grain_symbol, self._surface_prefix],
-        )
+        self._charge = self._count_charge()
+        self._key = self._identity()
+        self._hash = hash(self._key)
 
     def __copy__(self) -> Species:
-        return type(self)(
-            self.name,
-            self._grain_symbol,
-            self._surface_prefix,
-            self._bulk_prefix,
-        )
+        # copy the parsed state instead of parsing the name again: the name
+        # may already be replaced, which the element context cannot parse
+        spec = type(self).__new__(type(self))
+        for cls in type(self).__mro__:
+            for attr in getattr(cls, "__slots__", ()):
+                if hasattr(self, attr):
+                    setattr(spec, attr, getattr(self, attr))
+        spec.element_count = dict(self.element_count)
+        spec._cache = dict(self._cache)
+        spec._interned = False
+        return spec
 
     def __eq__(self, o: Species) -> bool:
         if isinstance(o, Species):
-            return (
-                (self.is_electron and o.is_electron)
-                or (
-                    self.is_grain
-                    and o.is_grain
-                    and self.grain_group == o.grain_group
-                    and self.charge == o.charge
-                )
-                or (
-                    self.is_surface
-                    and o.is_surface
-                    and self.surface_group == o.surface_group
-                    and self.charge == o.charge
-                    and self.basename == o.basename
-                )
-                or self.name == o.name
-            )
-            # return (self.is_electron and o.is_electron) or self.name == o.name
+            return self._key == o._key
         return NotImplemented
 
     def __hash__(self) -> int:
-        return (
-            hash("Electron")
-            if self.is_electron
-            else hash(
-                f"{self.basename}"
-                f"{self.charge}"
-                f"{self.is_grain}"
-                f"{self.grain_group}"
-                f"{self.is_surface}"
-                f"{self.surface_group}"
-            )
-        )
+        return self._hash
 
     def __lt__(self, o) -> bool:
         if isinstance(o, Species):
@@ -191,7 +241,7 @@ class Species:
             element (str): The name of the elements
             count (int): the number to be added into count
         """
-        if element in self._known_pseudoelements:
+        if element in self._context.pseudoelements:
             return
 
         elif element == self._surface_prefix:
@@ -222,44 +272,103 @@ class Species:
         else:
             self.element_count[element] = count
 
+    def _check_mutable(self, attr: str) -> None:
+        """Raise AttributeError if the species is interned, i.e. shared"""
+        if self._interned:
+            raise AttributeError(
+                f"Cannot set {attr} of the interned species {self.name}, "
+                "which is shared by all reactions and networks. "
+                "Set it on a copy (copy.copy) instead."
+            )
+
+    def _cached_data(self) -> dict:
+        """
+        The cache of derived names and values looked up from `chemistrydata`.
+        It is emptied when the user data are updated (e.g. `update_enthalpy`)
+        or the element context is changed.
+        """
+        context = self._context
+        context.prepare()
+        revision = (chemistrydata.revision(), context._generation)
+        if self._cache_revision != revision:
+            self._cache = {}
+            self._cache_revision = revision
+        return self._cache
+
+    def _indexed_elements(self) -> list[tuple]:
+        """
+        The (element, count) pairs of the known elements in the species, in the
+        order of the chemistry tables so that sums are accumulated as before
+        """
+        elements = [
+            (chemistrydata.element_position[symbol], symbol, count)
+            for symbol, count in self.element_count.items()
+            if symbol in chemistrydata.element_position
+        ]
+        return [
+            (chemistrydata.element_index[symbol], count)
+            for _, symbol, count in sorted(elements)
+        ]
+
+    def _count_charge(self) -> int:
+        """
+        Count the number of "+" and "-" in the end of the name
+        """
+        if self.is_electron:
+            return -1
+
+        pcharge = len(self.name) - len(self.name.rstrip("+"))
+        ncharge = len(self.name) - len(self.name.rstrip("-"))
+        return pcharge - ncharge
+
+    def _identity(self) -> tuple[str, int, int, int]:
+        """
+        The key used to compare species. Electrons are the same species
+        regardless of the name (e.g. E, e-). Grains are identified by their
+        groups and charges. Surface species are identified by their base names,
+        charges and surface groups.
+
+        Returns:
+            tuple[str, int, int, int]: (basename, charge, grain group, surface
+            group), where the groups are -1 if not applicable.
+        """
+        if self.is_electron:
+            return ("e", -1, -1, -1)
+
+        elif self._is_grain:
+            return ("", self._charge, self._grain_group, -1)
+
+        elif self._is_surface:
+            return (self.basename, self._charge, -1, self._surface_group)
+
+        return (self.basename, self._charge, -1, -1)
+
     @classmethod
     def _check_elements(cls) -> None:
         """
         Check whether repeated elements exist in `_known_elements` and
         `_known_pseudoelements` lists.
         """
-        all_element = cls._known_elements + cls._known_pseudoelements
-        dup_element = [ele for ele in all_element if all_element.count(ele) > 1]
-        if dup_element:
-            logging.error(
-                f"Repeated definitions of {dup_element} in elements and pseudoelemts"
-            )
+        _check_elements(cls._known_elements, cls._known_pseudoelements)
 
-    def _parse_molecule_name(self, elements: list[str], symbols: list[str]) -> None:
+    def _parse_molecule_name(self, symbols: list[str]) -> None:
         """
         Parse the name of the species to get the composition of elements.
 
+        Args:
+            symbols (list[str]): the grain and surface symbols
+
         Raises:
             RuntimeError: [description]
         """
 
-        parsename = self.name
         # remove charge symbols
-        parsename = re.sub(r"\+*$", "", parsename)
-        parsename = re.sub(r"-*$", "", parsename)
+        parsename = self.name.rstrip("+").rstrip("-")
         charge = self.name.replace(parsename, "")
 
-        components = sorted(elements + symbols, key=len, reverse=True)
-
-        firstparse = parsename
-        matches = []
-        for c in components:
-            for it in re.finditer(c, firstparse):
-                matches.append(it)
-                start, end = it.start(), it.end()
-                # remove the found items to avoid repeatance (e.g. S in Si)
-                firstparse = firstparse[:start] + " " * (end - start) + firstparse[end:]
-        matches = sorted(matches, key=lambda x: x.start())
+        replacement = self._context.replacement
+        tokenizer = self._context.tokenizer(tuple(symbols))
+        matches = list(tokenizer.finditer(parsename))
 
         # to check the number of elements, we need the end of last match and
         # the start of the next one
@@ -278,7 +387,7 @@ class Species:
 
         for s, e, n in zip(starts, ends, matchnames):
             # if there is replacement, save the element name with the new value
-            n = self._replacement.get(n, n)
+            n = replacement.get(n, n)
             if e != s:
                 substring = parsename[e:s]
                 if substring.isdigit():
@@ -294,10 +403,10 @@ class Species:
                     self._add_element_count(n, 1)
 
         # replace the original species name if the element name is in the replace target
-        if self._replacement:
+        if replacement:
             newname = ""
             for s, e, n in zip(starts, ends, matchnames):
-                nr = self._replacement.get(n, n)
+                nr = replacement.get(n, n)
                 newname = f"{newname}{nr}{parsename[e:s]}"
             self.name = f"{newname}{charge}"
 
@@ -330,6 +439,7 @@ class Species:
             else:
                 cls._known_elements.append(ele)
         cls._check_elements()
+        cls.clear_registry()
         return cls._known_elements
 
     @classmethod
@@ -363,6 +473,7 @@ class Species:
             else:
                 cls._known_pseudoelements.append(ele)
         cls._check_elements()
+        cls.clear_registry()
         return cls._known_pseudoelements
 
     @property
@@ -379,12 +490,7 @@ class Species:
             basename = self.basename
             # TODO: The replacement does not guarantee the correctness
             # e.g. CO could be replaced by Co if Co exists in the known element list
-            replacement = {
-                e.Symbol.upper(): e.Symbol
-                for e in chemistrydata.periodic_table + chemistrydata.isotopes_table
-                if e.Symbol.upper() in self._known_elements
-            }
-            for key, value in replacement.items():
+            for key, value in self._context.alias_replacement().items():
                 basename = basename.replace(key, value)
             self._alias = "{}{}{}".format(
                 "G" if self.is_surface else "",
@@ -395,24 +501,29 @@ class Species:
 
     @alias.setter
     def alias(self, name: str):
+        self._check_mutable("alias")
         self._alias = name
 
     @property
     def basename(self) -> str:
         """The species name without surface symbols and charges."""
 
-        basename = self.name
-        # remove surface symbol
-        if self.is_surface:
-            prefix = f"{self._surface_prefix}{self._surface_group or ''}"
-            basename = basename.replace(prefix, "")
+        cache = self._cached_data()
+        if "basename" not in cache:
+            basename = self.name
+            # remove surface symbol
+            if self.is_surface:
+                prefix = f"{self._surface_prefix}{self._surface_group or ''}"
+                basename = basename.replace(prefix, "")
 
-        # remove charge symbols
-        if self.charge != 0:
-            basename = re.sub(r"\+*$", "", basename)
-            basename = re.sub(r"-*$", "", basename)
+            # remove charge symbols
+            if self.charge != 0:
+                basename = re.sub(r"\+*$", "", basename)
+                basename = re.sub(r"-*$", "", basename)
 
-        return basename
+            cache["basename"] = basename
+
+        return cache["basename"]
 
     @property
     def binding_energy(self) -> float:
@@ -429,11 +540,16 @@ class Species:
         if not self.is_surface:
             raise ValueError(f"{self.name} is not ice species, has no binding energy")
 
-        eb = (
-            self._binding_energy
-            or chemistrydata.user_binding_energy.get(self.name)
-            or chemistrydata.rate12_binding_energy.get(self.gasname)
-        )
+        if self._binding_energy:
+            return self._binding_energy
+
+        cache = self._cached_data()
+        if "binding_energy" not in cache:
+            cache["binding_energy"] = chemistrydata.user_binding_energy.get(
+                self.name
+            ) or chemistrydata.rate12_binding_energy.get(self.gasname)
+
+        eb = cache["binding_energy"]
 
         if not eb:
             raise RuntimeError(f"Cannot find the binding energy of {self.name}")
@@ -442,6 +558,7 @@ class Species:
 
     @binding_energy.setter
     def binding_energy(self, eb: float) -> None:
+        self._check_mutable("binding_energy")
         self._binding_energy = eb
 
     # alias function
@@ -452,12 +569,7 @@ class Species:
         """
         Total charge of the species. Calculate the number of "+" and "-" in the end
         """
-        if self.is_electron:
-            return -1
-
-        pcharge = "".join(re.findall(r"\+*$", self.name)).count("+")
-        ncharge = "".join(re.findall(r"-*$", self.name)).count("-")
-        return pcharge - ncharge
+        return self._charge
 
     @property
     def enthalpy(self) -> float:
@@ -467,22 +579,110 @@ class Species:
         if not self.is_surface:
             return 0.0
 
-        avails = {e.Species: float(e.Enthalpy) for e in chemistrydata.enthalpy_table}
+        if self._enthalpy:
+            return self._enthalpy
+
+        cache = self._cached_data()
+        if "enthalpy" not in cache:
+            cache["enthalpy"] = chemistrydata.user_enthalpy.get(
+                self.name
+            ) or chemistrydata.enthalpy_index.get(self.gasname, 0.0)
 
-        return self._enthalpy or avails.get(self.gasname, 0.0)
+        return cache["enthalpy"]
 
     @enthalpy.setter
     def enthalpy(self, val: float) -> None:
+        self._check_mutable("enthalpy")
         self._enthalpy = val
 
+    @classmethod
+    def from_names(
+        cls,
+        names: Iterable[str],
+        grain_symbol: str = "GRAIN",
+        surface_prefix: str = "#",
+        bulk_prefix: str = "@",
+        context: ElementContext = None,
+        processes: int = None,
+    ) -> list[Species]:
+        """
+        Create the species of many names at once. Each unique name is parsed
+        only once and the species are interned (see `intern`), so repeated
+        names share the same instance.
+
+        Examples:
+            ```binding = {"#CO": 1150.0, "#H2O": 5700.0}
+               species = Species.from_names(binding)
+               binding = {s.name: eb for s, eb in zip(species, binding.values())}
+            ```
+
+        Args:
+            names (Iterable[str]): names of the species
+            grain_symbol (str, optional): Defaults to "GRAIN".
+            surface_prefix (str, optional): Defaults to "#".
+            bulk_prefix (str, optional): Defaults to "@".
+            context (ElementContext, optional): Defaults to the active context.
+            processes (int, optional): the number of processes to parse the
+                names, only worth for very long lists. Defaults to None, parse
+                in the current process.
+
+        Returns:
+            list[Species]: the species in the order of names
+        """
+        names = list(names)
+        context = context or ElementContext.current()
+        context.prepare()
+
+        symbols = (grain_symbol, surface_prefix, bulk_prefix)
+        registry = context._registry
+        unique = {name: registry.get((name, *symbols)) for name in names}
+        missing = [name for name, species in unique.items() if species is None]
+
+        if processes and processes > 1 and len(missing) > processes:
+            # the default context reads the class attributes, which are not
+            # shared by the workers
+            snapshot = ElementContext(
+                context.elements, context.pseudoelements, context.replacement
+            )
+            chunksize = -(-len(missing) // (processes * 4))
+            chunks = [
+                missing[i : i + chunksize] for i in range(0, len(missing), chunksize)
+            ]
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                parsed = executor.map(
+                    _parse_species,
+                    [cls] * len(chunks),
+                    chunks,
+                    [symbols] * len(chunks),
+                    [snapshot] * len(chunks),
+                )
+                for chunk, species in zip(chunks, parsed):
+                    for name, spec in zip(chunk, species):
+                        spec._context = context
+                        cls._register(context, (name, *symbols), spec)
+                        unique[name] = spec
+
+        for name in missing:
+            if unique[name] is None:
+                unique[name] = cls.intern(name, *symbols, context=context)
+
+        return [unique[name] for name in names]
+
     @property
     def gasname(self) -> str:
         """
         Return the name of its gas-phase species if this species is at ice-phase.
         Else return the current name.
         """
-        prefix = f"{self._surface_prefix}{self._surface_group or ''}"
-        return self.name.replace(prefix, "") if self.is_surface else self.name
+        if not self.is_surface:
+            return self.name
+
+        cache = self._cached_data()
+        if "gasname" not in cache:
+            prefix = f"{self._surface_prefix}{self._surface_group or ''}"
+            cache["gasname"] = self.name.replace(prefix, "")
+
+        return cache["gasname"]
 
     @property
     def grain_group(self) -> int:
@@ -520,6 +720,68 @@ class Species:
     def is_grain(self) -> bool:
         return self._is_grain
 
+    @classmethod
+    def intern(
+        cls,
+        name: str,
+        grain_symbol: str = "GRAIN",
+        surface_prefix: str = "#",
+        bulk_prefix: str = "@",
+        context: ElementContext = None,
+    ) -> Species:
+        """
+        Return a shared Species instance of the name.
+
+        The species name is parsed only once for each set of symbols in an
+        element context, later calls return the same instance, whose setters
+        raise AttributeError since it is shared by all callers. The least
+        recently used species are dropped when the registry exceeds
+        `registry_size`. The registry of the default context is cleared when
+        the known elements, pseudo-elements or replacements are changed
+        through the class methods.
+
+        Args:
+            name (str): name of the species
+            grain_symbol (str, optional): Defaults to "GRAIN".
+            surface_prefix (str, optional): Defaults to "#".
+            bulk_prefix (str, optional): Defaults to "@".
+            context (ElementContext, optional): Defaults to the active context.
+
+        Returns:
+            Species: the interned species
+        """
+        context = context or ElementContext.current()
+        context.prepare()
+
+        key = (name, grain_symbol, surface_prefix, bulk_prefix)
+        species = context._registry.get(key)
+
+        if species is None:
+            species = cls(name, grain_symbol, surface_prefix, bulk_prefix, context)
+            cls._register(context, key, species)
+        else:
+            context._registry.move_to_end(key)
+
+        return species
+
+    @classmethod
+    def _register(cls, context: ElementContext, key: tuple, species: Species) -> None:
+        """
+        Add a species into the registry of the context, and drop the least
+        recently used species if the registry exceeds `registry_size`.
+        """
+        species._interned = True
+        registry = context._registry
+        registry[key] = species
+        registry.move_to_end(key)
+        if len(registry) > cls.registry_size:
+            registry.popitem(last=False)
+
+    @classmethod
+    def clear_registry(cls) -> None:
+        """Drop all interned species and cached patterns of the default context"""
+        _default_context.clear()
+
     @property
     def is_surface(self) -> bool:
         """
@@ -531,42 +793,34 @@ class Species:
     @classmethod
     def known_elements(cls) -> list:
         """
-        Returns the current list of known elements
+        Returns the current list of known elements in the active context
 
         Returns:
             list: the current list of known elements
         """
-        # return the default element list if none of them initialized
-        if not cls._known_elements and not cls._known_pseudoelements:
-            return cls.default_elements
-        else:
-            return cls._known_elements
+        return ElementContext.current().elements
 
     @classmethod
     def known_pseudoelements(cls) -> list:
         """
-        Returns the current list of known pseudo elements
+        Returns the current list of known pseudo elements in the active context
 
         Returns:
             list: the current list of known pseudo elements
         """
-        # return the default pseudo element list if none of them initialized
-        if not cls._known_elements and not cls._known_pseudoelements:
-            return cls.default_pseudoelements
-        else:
-            return cls._known_pseudoelements
+        return ElementContext.current().pseudoelements
 
     @property
     def mass(self) -> float:
         """
         The mass (amu) of the species, estimated by summing the mass of elements
         """
-        if self._mass:
+        if self._mass is not None:
             return self._mass
 
         self._mass = 0.0
-        for e in chemistrydata.periodic_table + chemistrydata.isotopes_table:
-            self._mass += self.element_count.get(e.Symbol, 0) * float(e.AtomicMass)
+        for element, count in self._indexed_elements():
+            self._mass += count * float(element.AtomicMass)
 
         # ? electron mass
         # self._mass -= 0.00054858 * self.charge
@@ -582,13 +836,13 @@ class Species:
         """
         The mass number (neutron + proton) of the species
         """
-        if self._massnumber:
+        if self._massnumber is not None:
             return self._massnumber
 
         self._massnumber = 0.0
-        for e in chemistrydata.periodic_table + chemistrydata.isotopes_table:
-            self._massnumber += self.element_count.get(e.Symbol, 0) * (
-                float(e.NumberofNeutrons) + float(e.NumberofProtons)
+        for element, count in self._indexed_elements():
+            self._massnumber += count * (
+                float(element.NumberofNeutrons) + float(element.NumberofProtons)
             )
 
         # TODO: PAH, GRAIN, electron
@@ -624,10 +878,18 @@ class Species:
         if not self.is_surface:
             logging.fatal(f"{self.name} is not ice species! No photodesorption yield")
 
-        return self._photon_yield or chemistrydata.user_photon_yield.get(self.name, 0.0)
+        if self._photon_yield:
+            return self._photon_yield
+
+        cache = self._cached_data()
+        if "photon_yield" not in cache:
+            cache["photon_yield"] = chemistrydata.user_photon_yield.get(self.name, 0.0)
+
+        return cache["photon_yield"]
 
     @photon_yield.setter
     def photon_yield(self, phyld: float) -> None:
+        self._check_mutable("photon_yield")
         self._photon_yield = phyld
 
     @classmethod
@@ -650,6 +912,7 @@ class Species:
         for ele in elements:
             cls._known_elements.remove(ele)
         cls._check_elements()
+        cls.clear_registry()
         return cls._known_elements
 
     @classmethod
@@ -672,6 +935,7 @@ class Species:
         for ele in pelements:
             cls._known_pseudoelements.remove(ele)
         cls._check_elements()
+        cls.clear_registry()
         return cls._known_pseudoelements
 
     @classmethod
@@ -683,6 +947,7 @@ class Species:
         cls._known_elements = []
         cls._known_pseudoelements = []
         cls._replacement = {}
+        cls.clear_registry()
 
     @classmethod
     def set_known_elements(cls, elements: list) -> None:
@@ -701,8 +966,10 @@ class Species:
         if not isinstance(elements, list):
             raise TypeError(f"{elements} is not a list")
 
-        cls._known_elements.clear()
-        cls._known_elements.extend(elements)
+        if elements != cls._known_elements:
+            cls._known_elements.clear()
+            cls._known_elements.extend(elements)
+            cls.clear_registry()
         cls._check_elements()
 
     @classmethod
@@ -722,15 +989,339 @@ class Species:
         if not isinstance(pelements, list):
             raise TypeError(f"{pelements} is not a list")
 
-        cls._known_pseudoelements.clear()
-        cls._known_pseudoelements.extend(pelements)
+        if pelements != cls._known_pseudoelements:
+            cls._known_pseudoelements.clear()
+            cls._known_pseudoelements.extend(pelements)
+            cls.clear_registry()
         cls._check_elements()
 
+    @classmethod
+    def set_replacement(cls, replacement: dict[str, str]) -> None:
+        """
+        Set the replacement of element names, which are applied to the names
+        of species
+
+        Args:
+            replacement (dict[str, str]): the map from the element names found
+                in species names to the new element names
+
+        Raises:
+            TypeError: If argument is not a dict
+        """
+        if not isinstance(replacement, dict):
+            raise TypeError(f"{replacement} is not a dict")
+
+        cls._replacement = replacement.copy()
+        cls.clear_registry()
+
     @property
     def surface_group(self) -> int:
         return self._surface_group
 
 
+def _parse_species(
+    cls: type[Species],
+    names: list[str],
+    symbols: tuple[str, str, str],
+    context: ElementContext,
+) -> list[Species]:
+    """Parse the names of species in a worker process of `Species.from_names`"""
+    return [cls(name, *symbols, context) for name in names]
+
+
+class ElementContext:
+    """
+    The known elements, pseudo-elements and replacements used to parse species
+    names, together with the species interned under them.
+
+    A context is activated by `activate`, species created inside the `with`
+    block are parsed with its elements. Since the context is never changed
+    after creation and the active one is stored in a context variable,
+    networks with different elements can be parsed in threads at the same
+    time. The default context (used when no context is active) reads the class
+    attributes of `Species` instead.
+
+    Examples:
+        ```context = ElementContext(["H", "He", "e"], ["CR"])
+           with context.activate():
+               species = Species("HeH+")
+        ```
+
+    Attributes:
+        elements (list[str]): the known elements
+        pseudoelements (list[str]): the known pseudo-elements
+        replacement (dict[str, str]): the replacement of element names
+    """
+
+    def __init__(
+        self,
+        elements: list[str] = None,
+        pseudoelements: list[str] = None,
+        replacement: dict[str, str] = None,
+    ) -> None:
+        """
+        Initializes ElementContext. The default elements and pseudo-elements
+        of `Species` are used if none of them is provided.
+
+        Args:
+            elements (list[str], optional): names of elements. Defaults to None.
+            pseudoelements (list[str], optional): names of pseudo-elements.
+                Defaults to None.
+            replacement (dict[str, str], optional): the map from the element
+                names found in species names to new names. Defaults to None.
+        """
+        if not elements and not pseudoelements:
+            elements = Species.default_elements
+            pseudoelements = Species.default_pseudoelements
+
+        self._elements = list(elements or [])
+        self._pseudoelements = list(pseudoelements or [])
+        self._replacement = dict(replacement or {})
+        _check_elements(self._elements, self._pseudoelements)
+        self.clear()
+
+    def __getstate__(self) -> dict:
+        # the interned species and compiled patterns are not shared by processes
+        state = self.__dict__.copy()
+        for cache in ["_registry", "_tokenizers", "_alias_replacement", "_contents"]:
+            state.pop(cache, None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.clear()
+
+    @contextmanager
+    def activate(self) -> Iterator[ElementContext]:
+        """
+        Use this context to create species in the `with` block
+        """
+        token = _active_context.set(self)
+        try:
+            yield self
+        finally:
+            _active_context.reset(token)
+
+    def alias_replacement(self) -> dict[str, str]:
+        """
+        The map from the capital element symbols to the standard symbols,
+        for the element symbols in the known elements. Used in `Species.alias`.
+
+        Returns:
+            dict[str, str]: the map of symbols
+        """
+        if self._alias_replacement is None:
+            elements = set(self.elements)
+            self._alias_replacement = {
+                symbol.upper(): symbol
+                for symbol in chemistrydata.element_index
+                if symbol.upper() in elements
+            }
+        return self._alias_replacement
+
+    def clear(self) -> None:
+        """Drop the interned species and the cached patterns"""
+        self._registry = OrderedDict()
+        self._tokenizers = {}
+        self._alias_replacement = None
+        # the values cached by species are dropped with a new generation
+        self._contents = self._snapshot()
+        self._generation = next(_context_generation)
+
+    @staticmethod
+    def current() -> ElementContext:
+        """
+        The active element context, or the default one if none is active
+
+        Returns:
+            ElementContext: the active context
+        """
+        context = _active_context.get()
+        return _default_context if context is None else context
+
+    @property
+    def elements(self) -> list[str]:
+        return self._elements
+
+    def prepare(self) -> None:
+        """
+        Check the context is up to date before parsing species. The caches are
+        dropped if the elements, pseudo-elements or replacement were changed
+        in place since they were created.
+        """
+        elements, pseudoelements, replacement = self._contents
+        if (
+            self.elements != elements
+            or self.pseudoelements != pseudoelements
+            or self.replacement != replacement
+        ):
+            self.clear()
+
+    @property
+    def pseudoelements(self) -> list[str]:
+        return self._pseudoelements
+
+    @property
+    def replacement(self) -> dict[str, str]:
+        return self._replacement
+
+    def _snapshot(self) -> tuple[list[str], list[str], dict[str, str]]:
+        """Copies of the elements, pseudo-elements and replacement"""
+        return list(self.elements), list(self.pseudoelements), dict(self.replacement)
+
+    def tokenizer(self, symbols: tuple[str]) -> re.Pattern:
+        """
+        Get the compiled pattern matching all elements, pseudo-elements and the
+        symbols in a single pass.
+
+        Args:
+            symbols (tuple[str]): the grain and surface symbols
+
+        Returns:
+            re.Pattern: the alternation of all components
+        """
+        tokenizer = self._tokenizers.get(symbols)
+        if tokenizer is None:
+            components = [*self.elements, *self.pseudoelements, *symbols]
+            # try the longer names first to avoid repeatance (e.g. S in Si)
+            ordered = sorted(components, key=len, reverse=True)
+            tokenizer = re.compile("|".join(ordered))
+            self._tokenizers[symbols] = tokenizer
+        return tokenizer
+
+
+class _DefaultElementContext(ElementContext):
+    """
+    The element context backed by the class attributes of `Species`, which are
+    changed by the class methods of `Species` (e.g. `set_known_elements`).
+    """
+
+    def __init__(self) -> None:
+        self.clear()
+
+    @property
+    def elements(self) -> list[str]:
+        if not Species._known_elements and not Species._known_pseudoelements:
+            return Species.default_elements
+        return Species._known_elements
+
+    def prepare(self) -> None:
+        # the class attributes may be changed without the class methods
+        elements, pseudoelements, replacement = self._contents
+        if (
+            Species._known_elements == elements
+            and Species._known_pseudoelements == pseudoelements
+            and Species._replacement == replacement
+        ):
+            return
+
+        # Initialize known elements if not set when the fist species is instanciated
+        if not Species._known_elements and not Species._known_pseudoelements:
+            logging.warning("No assigned known element list. Use default elements")
+
+            Species._known_elements.extend(Species.default_elements)
+            Species._known_pseudoelements.extend(Species.default_pseudoelements)
+
+        self.clear()
+
+    @property
+    def pseudoelements(self) -> list[str]:
+        if not Species._known_elements and not Species._known_pseudoelements:
+            return Species.default_pseudoelements
+        return Species._known_pseudoelements
+
+    @property
+    def replacement(self) -> dict[str, str]:
+        return Species._replacement
+
+
+_default_context = _DefaultElementContext()
+
+
+class Composition:
+    """
+    The element composition of a list of species, a sparse (species x elements)
+    integer matrix of the element counts.
+
+    Examples:
+        ```composition = Composition(network.species)
+           # the total abundances of elements
+           elemabund = abundances @ composition.matrix
+        ```
+
+    Attributes:
+        species (list[Species]): the species, in the order of rows
+        elements (list[str]): the elements, in the order of columns
+        species_index (dict[Species, int]): the row of each species
+        element_index (dict[str, int]): the column of each element
+        rows (list[list[tuple[int, int]]]): the (column, count) of the elements
+            in each species, in the order of columns
+    """
+
+    def __init__(self, species: list[Species]) -> None:
+        self.species = list(species)
+        self.species_index = {spec: row for row, spec in enumerate(self.species)}
+        self.element_index = {}
+        self.rows = []
+        for spec in self.species:
+            row = []
+            for element, count in spec.element_count.items():
+                if count:
+                    column = self.element_index.setdefault(
+                        element, len(self.element_index)
+                    )
+                    row.append((column, count))
+            self.rows.append(sorted(row))
+        self.elements = list(self.element_index)
+        self._matrix = None
+
+    def column(self, element: str) -> list[tuple[int, int]]:
+        """
+        The (row, count) of the species containing the element
+
+        Args:
+            element (str): name of the element
+
+        Returns:
+            list[tuple[int, int]]: the rows and the counts, in the order of rows
+        """
+        column = self.element_index.get(element)
+        return [
+            (irow, count)
+            for irow, row in enumerate(self.rows)
+            for col, count in row
+            if col == column
+        ]
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """
+        The dense matrix of element counts (requires numpy). It is read-only.
+        """
+        if self._matrix is None:
+            import numpy as np
+
+            matrix = np.zeros((len(self.species), len(self.elements)), dtype=int)
+            for irow, row in enumerate(self.rows):
+                for column, count in row:
+                    matrix[irow, column] = count
+            matrix.setflags(write=False)
+            self._matrix = matrix
+        return self._matrix
+
+
+@lru_cache(maxsize=16)
+def _composition(
+    species: tuple[Species], names: tuple[tuple[str, ElementContext], ...]
+) -> Composition:
+    """
+    The composition of species, cached for each species list. Equal species
+    can have different names (e.g. `E` and `e-`), so the names and contexts
+    of the species are a part of the key.
+    """
+    return Composition(species)
+
+
 def top_abundant_species(
     species_list: list[Species],
     abundances: list[float],
@@ -780,3 +1371,82 @@ def top_abundant_species(
         )
 
     return sorted_abund
+
+
+def top_abundant_species_array(
+    species_list: list[Species],
+    abundances: np.ndarray,
+    element: str = None,
+    rank: int = -1,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized `top_abundant_species` for the abundances of many cells. Find the
+    most abundant species in each cell, if element is provided, find the main
+    reservoirs of the element (ranked by abundance times the element count).
+
+    The composition of `species_list` is computed once and reused in later
+    calls with the same species list.
+
+    Args:
+        species_list (list[Species]): list of species, must have the same
+            order as the last axis of abundances
+        abundances (np.ndarray): the abundances of species, in shape of
+            (species,) or (cells, species)
+        element (str, optional): name of target element. Defaults to None.
+        rank (int, optional): the top n species to be shown. The sorted
+            species are sliced by `[:rank]` as in `top_abundant_species`, so
+            negative ranks drop the least abundant species. Defaults to -1.
+
+    Raises:
+        ValueError: The abundances do not match the species list.
+        RuntimeError: The element doesn't exist in any species.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: the indices in `species_list` of the most
+            abundant species and their abundances, in shape of (rank,) or
+            (cells, rank) and sorted in descending order
+    """
+    import numpy as np
+
+    abundances = np.asarray(abundances, dtype=float)
+    single = abundances.ndim == 1
+    abundances = np.atleast_2d(abundances)
+
+    if abundances.ndim != 2 or abundances.shape[1] != len(species_list):
+        raise ValueError(
+            f"Abundances in shape {abundances.shape} mismatch {len(species_list)} species"
+        )
+
+    candidates = np.arange(len(species_list))
+    weights = abundances
+
+    if element is not None:
+        composition = _composition(
+            tuple(species_list),
+            tuple((spec.name, spec._context) for spec in species_list),
+        )
+        counts = composition.matrix
+        column = composition.element_index.get(element)
+        if column is not None:
+            candidates = np.flatnonzero(counts[:, column])
+            weights = abundances[:, candidates] * counts[candidates, column]
+        else:
+            candidates = candidates[:0]
+
+    # the number of species left by slicing the sorted list with `[:rank]`
+    nspec = candidates.size
+    rank = len(range(nspec)[:rank])
+    if not rank:
+        raise RuntimeError(
+            "Undefined results. please check the element exists in the network."
+        )
+
+    # a stable sort keeps tied species in the order of the list, as `sorted`
+    top = np.argsort(-weights, axis=1, kind="stable")[:, :rank]
+
+    indices = candidates[top]
+    values = np.take_along_axis(abundances, indices, axis=1)
+
+    if single:
+        return indices[0], values[0]
+    return indices, values
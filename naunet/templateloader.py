@@ -10,7 +10,7 @@ from tqdm import tqdm
 from typing import TYPE_CHECKING
 from jinja2 import Template, Environment, PackageLoader
 
-from .species import Species
+from .species import Composition, Species
 from .reactions.reaction import Reaction
 from .reactiontype import ReactionType
 from .thermalprocess import ThermalProcess
@@ -38,6 +38,7 @@ class NetworkInfo:
     cooling: list[str]
     grains: list[Grain]
     shielding: dict
+    composition: Composition = None
 
 
 class TemplateLoader:
@@ -165,6 +166,7 @@ class TemplateLoader:
     ) -> ODEContent:
         species = netinfo.species
         reactions = netinfo.reactions
+        species_index = {spec: idx for idx, spec in enumerate(species)}
 
         heating = netinfo.heating
         cooling = netinfo.cooling
@@ -191,8 +193,8 @@ class TemplateLoader:
         rhs = ["0.0"] * n_eqns
         jacrhs = ["0.0"] * n_eqns * n_eqns
         for rl, react in enumerate(tqdm(reactions, desc="Preparing ODE...")):
-            rspecidx = [species.index(r) for r in react.reactants]
-            pspecidx = [species.index(p) for p in react.products]
+            rspecidx = [species_index[r] for r in react.reactants]
+            pspecidx = [species_index[p] for p in react.products]
 
             # Differential Equation
             rsym = [y[idx] for idx in rspecidx]
@@ -250,7 +252,7 @@ class TemplateLoader:
 
         # fex/jac of thermal process
         for hidx, h in enumerate(heating):
-            rspecidx = [species.index(r) for r in h.reactants]
+            rspecidx = [species_index[r] for r in h.reactants]
             rsym = [y[idx] for idx in rspecidx]
             rsym_mul = "*".join(rsym)
 
@@ -269,7 +271,7 @@ class TemplateLoader:
         crateeqns = self._assign_rates(crate_sym, cooling)
 
         for cidx, c in enumerate(cooling):
-            rspecidx = [species.index(r) for r in c.reactants]
+            rspecidx = [species_index[r] for r in c.reactants]
             rsym = [y[idx] for idx in rspecidx]
             rsym_mul = "*".join(rsym)
 
@@ -320,30 +322,39 @@ class TemplateLoader:
         # get the exact element string
         elements = netinfo.elements
         species = netinfo.species
+        composition = netinfo.composition or Composition(species)
         elemnames = [next(iter(elem.element_count)) for elem in elements]
+        nelem = len(elemnames)
 
-        matrix = []
-        for iele, einame in enumerate(elemnames):
-            for jele, ejname in enumerate(elemnames):
-                terms = ["0.0"]
-                for ispec, spec in enumerate(species):
-                    ci = spec.element_count.get(einame, 0)
-                    cj = spec.element_count.get(ejname, 0)
-                    if not spec.is_electron and ci and cj:
-                        terms.append(
-                            f"{(ci * cj * elements[jele].A)} * ab[IDX_{spec.alias}] / {spec.A} / Hnuclei"
-                        )
-                matrix.append(" + ".join(terms))
+        # the order of the renormalized elements in the composition
+        position = {
+            composition.element_index[ename]: iele
+            for iele, ename in enumerate(elemnames)
+        }
 
+        terms = [["0.0"] for _ in range(nelem * nelem)]
         renorm = []
-        for spec in species:
-            counts = [spec.element_count.get(ename, 0) for ename in elemnames]
+        for spec, row in zip(species, composition.rows):
+            counts = sorted(
+                (position[column], count) for column, count in row if column in position
+            )
+            if spec.is_electron:
+                renorm.append(1.0)
+                continue
+
+            for iele, ci in counts:
+                for jele, cj in counts:
+                    terms[iele * nelem + jele].append(
+                        f"{(ci * cj * elements[jele].A)} * ab[IDX_{spec.alias}] / {spec.A} / Hnuclei"
+                    )
+
             factor = [
-                f"{c * elem.A} * rptr[IDX_ELEM_{ename}] / {spec.A}"
-                for c, ename, elem in zip(counts, elemnames, elements)
-                if c
+                f"{c * elements[iele].A} * rptr[IDX_ELEM_{elemnames[iele]}] / {spec.A}"
+                for iele, c in counts
             ]
-            renorm.append(1.0 if spec.is_electron else " + ".join(factor))
+            renorm.append(" + ".join(factor))
+
+        matrix = [" + ".join(t) for t in terms]
 
         return self.RenormContent(renorm, matrix)
 
@@ -424,12 +435,14 @@ class TemplateLoader:
             network.cooling,
             network.grains,
             network.shielding,
+            network.composition,
         )
 
         speckws = network._species_kwargs
         rate_modifier = network.rate_modifier
         ode_modifier = network.ode_modifier
-        ode = self._prepare_ode_content(info, speckws, rate_modifier, ode_modifier)
+        with network.element_context.activate():
+            ode = self._prepare_ode_content(info, speckws, rate_modifier, ode_modifier)
         renorm = self._prepare_renorm_content(info)
 
         for tmplname in templates:
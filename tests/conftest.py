@@ -35,6 +35,35 @@ def datadir():
     return Path(__file__).absolute().parent / "data"
 
 
+def _reaction_fields(reaction):
+    """
+    The values stored in a reaction and its rate expression, to compare the
+    reactions read in bulk with those created line by line
+    """
+    if reaction is None:
+        return None
+    slots = [
+        slot
+        for cls in type(reaction).__mro__
+        for slot in getattr(cls, "__slots__", ())
+        if slot not in ("_symbols", "_rpkey")
+    ]
+    return (
+        [s.name for s in reaction.reactants],
+        [s.name for s in reaction.products],
+        {slot: getattr(reaction, slot) for slot in slots},
+        dict(reaction.params),
+        dict(reaction.deriveds),
+        reaction.react_string,
+        None if reaction.is_empty else reaction.rateexpr(),
+    )
+
+
+@pytest.fixture
+def reaction_fields():
+    return _reaction_fields
+
+
 @pytest.fixture
 def application():
     app = Application()
@@ -87,6 +87,31 @@ def test_eq_reaction(ref_reaction, target_reaction, is_equal, request):
     ) == is_equal
 
 
+def test_read_table(datadir, reaction_fields):
+    with open(datadir / "minimal.kida") as inpf:
+        lines = inpf.readlines()
+    lines[-1] = lines[-1].rstrip() + "\n"
+    # an indented line, an empty line, an invalid formula, and a line in
+    # another layout
+    invalid = lines[0].replace(" 3  4894 1  1", " 9  4894 1  1")
+    lines += [" " * 24 + lines[1], "\n", invalid, lines[1].rstrip() + " 1\n"]
+
+    table = KIDAReaction.read_table(lines)
+    assert len(table) == len(lines)
+    assert table.nparsed == len(lines) - 2
+    assert table[-2].formula == 3
+
+    # the fields are sliced from the stripped lines
+    assert table[-4].rpeq(table[1])
+    assert table[-4].alpha == table[1].alpha
+    for ln, line in enumerate(lines[:-1]):
+        expected = KIDAReaction(line)
+        assert reaction_fields(table[ln]) == reaction_fields(expected)
+
+    with pytest.raises(ValueError):
+        table[-1]
+
+
 @pytest.mark.slow
 def test_init_kidareaction_from_file(datadir):
     with open(datadir / "deuspin.kida", "r") as react_file:
@@ -0,0 +1,75 @@
+import pytest
+from naunet.reactions.kromereaction import KROMEReaction
+
+
+def test_read_table(datadir, reaction_fields):
+    with open(datadir / "primordial.krome") as inpf:
+        lines = inpf.readlines()
+    lines[-1] = lines[-1].rstrip() + "\n"
+    # a section with another format and user variables
+    lines += [
+        "@common: user_a\n",
+        "@var: foo = 2.0d0 * Tgas\n",
+        "@format:idx,R,R,P,P,Tmin,Tmax,rate\n",
+        "101,H+,E,H,g,>5.5e3,.LE.1d4,3.92d-13*invTe**0.6353d0*user_a\n",
+        "102,H+,E,H,g,NONE,NONE,3.92d-13*invTe**0.6353d0*user_a\n",
+        "x,H,E,H-,,NONE,NONE,foo\n",
+    ]
+
+    KROMEReaction.initialize()
+    table = KROMEReaction.read_table(lines)
+    assert len(table) == len(lines)
+    # the class settings are not changed by the table
+    assert KROMEReaction.reacformat == KROMEReaction.default_format
+
+    for ln, line in enumerate(lines[:-1]):
+        react_string = KROMEReaction.preprocessing(line)
+        if not react_string:
+            assert table[ln] is None
+            continue
+        expected = KROMEReaction(react_string)
+        assert reaction_fields(table[ln]) == reaction_fields(expected)
+
+    # identical rate expressions are shared
+    assert table[-2].rate_string is table[-3].rate_string
+    assert table[-2].rateexpr() == "3.92e-13 * pow(invTe, 0.6353e0) * user_a"
+
+    with pytest.raises(ValueError):
+        table[-1]
+
+
+def test_read_tables(datadir, reaction_fields):
+    with open(datadir / "primordial.krome") as inpf:
+        lines = inpf.readlines()
+    lines[-1] = lines[-1].rstrip() + "\n"
+    lines += [
+        "@format:idx,R,R,P,P,Tmin,Tmax,rate\n",
+        "101,H+,E,H,g,>5.5e3,.LE.1d4,3.92d-13*invTe**0.6353d0\n",
+        "102,H+,E,H,g,NONE,NONE,3.92d-13*invTe**0.6353d0\n",
+    ]
+
+    table = KROMEReaction.read_table(lines)
+    # the headers are kept across the chunks
+    tables = list(KROMEReaction.read_tables(lines, chunksize=len(lines) - 2))
+    assert [len(t) for t in tables] == [len(lines) - 2, 2]
+
+    chunked = tables[0][:] + tables[1][:]
+    assert list(map(reaction_fields, chunked)) == list(map(reaction_fields, table))
+    assert chunked[-1].rate_string is chunked[-2].rate_string
+
+
+def test_rateexpr_cache():
+    KROMEReaction.initialize()
+    KROMEReaction._convert_rate.cache_clear()
+
+    # the conversions are cached by the rate string and the header settings
+    line = "1,H,E,,H-,,,,NONE,NONE,3.d-16*foo"
+    first = KROMEReaction(line, variables=["foo = 2.0d0 * Tgas"])
+    second = KROMEReaction(line, variables=["foo = 3.0d0 * Tgas"])
+    assert first.rateexpr() == second.rateexpr() == "3.e-16 * foo"
+    assert (
+        first.rateexpr()
+        == KROMEReaction(line, variables=["foo = 2.0d0 * Tgas"]).rateexpr()
+    )
+    cache = KROMEReaction._convert_rate.cache_info()
+    assert (cache.hits, cache.currsize) == (2, 2)
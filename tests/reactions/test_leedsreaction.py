@@ -46,3 +46,16 @@ def test_eq_reaction(ref_reaction, target_reaction, is_equal, request):
         set([request.getfixturevalue(ref_reaction)])
         == set([request.getfixturevalue(target_reaction)])
     ) == is_equal
+
+
+def test_read_table(datadir, reaction_fields):
+    with open(datadir / "rate12_HO.leeds", "r") as react_file:
+        lines = react_file.readlines()
+    lines[-1] = lines[-1].rstrip("\n") + "\n"
+    # the replaced names of species are kept in the fixed-width fields
+    line = lines[0].replace("H-        H   ", "YC        H   ")
+
+    table = LEEDSReaction.read_table(lines + [line])
+    assert len(table) == table.nparsed == len(lines) + 1
+    assert table[-1].reactants[0].name == "CH2OHC"
+    assert reaction_fields(table[-1]) == reaction_fields(LEEDSReaction(line))
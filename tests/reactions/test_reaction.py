@@ -1,4 +1,5 @@
 import pytest
+import tracemalloc
 from naunet.species import Species
 from naunet.reactions.reaction import Reaction
 from naunet.reactiontype import ReactionType
@@ -195,6 +196,24 @@ def test_eq_reaction(example_cr_reaction1, reaction_args, is_equal):
     ) == is_equal
 
 
+def test_reaction_key(example_cr_reaction1):
+    reaction = example_cr_reaction1
+    other = Reaction(["He"], ["E", "He+"], -9999.0, 9999.0)
+    assert reaction.rpkey is reaction.rpkey
+    assert reaction.rpeq(other)
+    assert reaction == other and hash(reaction) == hash(other)
+    assert len({reaction, other}) == 1
+
+    other.products = [Species("He+")]
+    assert not reaction.rpeq(other)
+    assert reaction.key == (
+        reaction.rpkey,
+        -9999.0,
+        9999.0,
+        ReactionType.GAS_COSMICRAY,
+    )
+
+
 def test_contains(example_cr_reaction1):
     assert Species("He") in example_cr_reaction1
     assert Species("He+") in example_cr_reaction1
@@ -239,3 +258,61 @@ def test_reaction_str_format(example_cr_reaction1):
 def test_rateexpr(example_cr_reaction1):
     rate = "0.0 * zeta"
     assert example_cr_reaction1.rateexpr() == rate
+
+
+@pytest.fixture
+def compact_reaction():
+    Reaction.compact = True
+    yield
+    Reaction.compact = False
+
+
+def test_compact_reaction(compact_reaction):
+    react_string = (
+        "1, H, CR, , H+, e-, , , , 1.0e-17, 0.0, 0.0, 10.0, 41000.0, 101, umist"
+    )
+    reaction = Reaction(react_string=react_string)
+    assert not hasattr(reaction, "__dict__")
+    assert reaction.reactants == (Species("H"),)
+    assert reaction.products == (Species("H+"), Species("e-"))
+    assert reaction.react_string == react_string
+    assert Reaction(react_string=reaction.react_string) == reaction
+
+
+@pytest.mark.slow
+def test_benchmark_compact_reaction():
+    # synthetic network of 100k reactions among 1000 species
+    Species.reset()
+    names = [f"C{i}H{j}" for i in range(1, 11) for j in range(1, 101)]
+
+    def react_string(i):
+        return ", ".join(
+            [
+                f"{i}",
+                *(names[(k * i) % 1000] for k in [1, 7]),
+                "",
+                *(names[(k * i) % 1000] for k in [3, 11]),
+                *["", "", ""],
+                f"{1e-10 * (1 + i % 97)}",
+                f"{0.01 * (i % 13)}",
+                f"{i % 101}.0",
+                "10.0",
+                "41000.0",
+                "100",
+                "synthetic",
+            ]
+        )
+
+    usage = {}
+    for compact in [False, True]:
+        Reaction.compact = compact
+        tracemalloc.start()
+        reactions = [Reaction(react_string=react_string(i)) for i in range(100000)]
+        usage[compact], _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del reactions
+    Reaction.compact = False
+
+    # the compact reactions (tuples of species) use about 10% less memory
+    assert usage[True] / usage[False] < 0.95
+    Species.reset()
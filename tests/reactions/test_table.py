@@ -0,0 +1,123 @@
+import bz2
+import gzip
+import lzma
+import sys
+import pytest
+from naunet.reactions.kidareaction import KIDAReaction
+from naunet.reactions.kromereaction import KROMEReaction
+from naunet.reactions.leedsreaction import LEEDSReaction
+from naunet.reactions.table import ReactionTable, parse_columns, read_chunks
+from naunet.reactions.uclchemreaction import UCLCHEMReaction
+from naunet.reactions.umistreaction import UMISTReaction
+
+fields = [("idx", int), (None, str), ("code", str), ("alpha", float)]
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_parse_columns(numpy, monkeypatch):
+    if not numpy:
+        monkeypatch.setitem(sys.modules, "numpy", None)
+
+    rows, columns = parse_columns(["1:H:NN:1.0e-10\n", "2:H2:CR: 3.5\n"], fields, ":")
+    assert rows == [0, 1]
+    assert list(columns) == ["idx", "code", "alpha"]
+    assert list(columns["idx"]) == [1, 2]
+    assert list(columns["code"]) == ["NN", "CR"]
+    assert list(columns["alpha"]) == [1.0e-10, 3.5]
+
+    texts = ["1:H:NN:1.0\n", "2:H2:CR\n", "x:H:NN:1.0\n", "\n", "4:H:NN:2.0"]
+    rows, columns = parse_columns(texts, fields, ":")
+    assert rows == [0, 4]
+    assert list(columns["alpha"]) == [1.0, 2.0]
+
+
+@pytest.mark.parametrize(
+    "suffix, opener",
+    [("", open), (".gz", gzip.open), (".bz2", bz2.open), (".xz", lzma.open)],
+)
+def test_read_chunks(suffix, opener, tmp_path):
+    lines = [f"{i}:H:NN:1.0\n" for i in range(7)]
+    path = tmp_path / f"reactions.umist{suffix}"
+    with opener(path, "wt") as outf:
+        outf.writelines(lines)
+
+    chunks = list(read_chunks(path, 3))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert sum(chunks, []) == lines
+    assert list(read_chunks(iter(lines), 7)) == [lines]
+
+
+def test_default_from_table(datadir):
+    with open(datadir / "minimal.ucl") as inpf:
+        lines = inpf.readlines()
+
+    # formats without a bulk reader create the rows from their lines
+    table = ReactionTable(UCLCHEMReaction, lines, rows=range(len(lines)))
+    assert table.nparsed == len(lines)
+    for reaction, line in zip(table, lines):
+        assert reaction == UCLCHEMReaction(UCLCHEMReaction.preprocessing(line))
+
+
+@pytest.mark.parametrize(
+    "rclass, filename",
+    [
+        (KIDAReaction, "minimal.kida"),
+        (UMISTReaction, "rate12.umist"),
+        (LEEDSReaction, "rate12_HO.leeds"),
+        (KROMEReaction, "primordial.krome"),
+    ],
+)
+def test_read_table_by_lines(rclass, filename, datadir, reaction_fields):
+    with open(datadir / filename) as inpf:
+        lines = inpf.readlines()
+
+    rclass.initialize()
+    table = rclass.read_table(lines)
+    assert len(table) == len(lines)
+    assert table.nparsed
+
+    # the reactions are the same as those created line by line
+    rclass.initialize()
+    for line, reaction in zip(lines, table):
+        react_string = rclass.preprocessing(line)
+        expected = rclass(react_string=react_string) if react_string else None
+        assert reaction_fields(reaction) == reaction_fields(expected)
+
+    # and the same in the chunks of the file
+    chunked = [r for t in rclass.read_tables(lines, chunksize=5) for r in t]
+    assert list(map(reaction_fields, chunked)) == list(map(reaction_fields, table))
+
+
+@pytest.mark.parametrize(
+    "rclass, filename",
+    [
+        (KIDAReaction, "minimal.kida"),
+        (UMISTReaction, "rate12.umist"),
+        (LEEDSReaction, "rate12_HO.leeds"),
+        (KROMEReaction, "primordial.krome"),
+    ],
+)
+def test_compact_react_string(rclass, filename, datadir, monkeypatch):
+    with open(datadir / filename) as inpf:
+        lines = inpf.readlines()
+
+    monkeypatch.setattr(rclass, "compact", True)
+    rclass.initialize()
+    table = rclass.read_table(lines)
+
+    # the compact reactions keep the lines, which are parsed to the same
+    # reactions again
+    rclass.initialize()
+    for line, reaction in zip(lines, table):
+        react_string = rclass.preprocessing(line)
+        if not react_string or reaction.is_empty:
+            continue
+        for compact in [reaction, rclass(react_string=react_string)]:
+            assert isinstance(compact.reactants, tuple)
+            parsed = rclass(react_string=rclass.preprocessing(compact.react_string))
+            assert parsed.key == compact.key
+            assert parsed.rateexpr() == compact.rateexpr()
+            assert (parsed.temp_min, parsed.temp_max) == (
+                compact.temp_min,
+                compact.temp_max,
+            )
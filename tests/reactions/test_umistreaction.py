@@ -1,3 +1,4 @@
+import gzip
 from naunet.reactions.umistreaction import UMISTReaction
 
 
@@ -7,3 +8,18 @@ def test_init_umistreaction_from_file(datadir):
             reaction = UMISTReaction(line)
             # check all non-empty reactions produce a reaction rate
             assert reaction.is_empty or reaction.rateexpr()
+
+
+def test_read_table(datadir, tmp_path, reaction_fields):
+    with open(datadir / "rate12.umist", "r") as react_file:
+        lines = react_file.readlines()
+
+    compressed = tmp_path / "rate12.umist.gz"
+    with gzip.open(compressed, "wt") as outf:
+        outf.writelines(lines)
+
+    # all reactions are parsed by the colon-delimited reader
+    table = UMISTReaction.read_table(compressed)
+    assert table.nparsed == len([line for line in lines if line.strip()])
+    expected = UMISTReaction.read_table(lines)
+    assert list(map(reaction_fields, table)) == list(map(reaction_fields, expected))
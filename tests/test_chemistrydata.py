@@ -0,0 +1,56 @@
+import hashlib
+import pickle
+from naunet import chemistrydata
+
+
+def test_lazy_tables(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert "element_index" in dir(chemistrydata)
+    assert chemistrydata.element_index["He"].Symbol == "He"
+    assert chemistrydata.periodic_table[0].Symbol == "H"
+    assert chemistrydata.enthalpy_index["CO"] == -113.8
+    assert chemistrydata.rate12_binding_energy["CO"] == 1150.0
+
+    # the cache is written at the first load
+    assert chemistrydata._load_sources() == chemistrydata._read_sources()
+    assert chemistrydata.cache_path().exists()
+
+
+def write_cache(path, key, data, checksum=None):
+    payload = pickle.dumps(data)
+    checksum = checksum or hashlib.sha256(payload).hexdigest().encode()
+    path.write_bytes(b"\n".join([key, checksum, payload]))
+
+
+def test_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    path = chemistrydata.cache_path()
+    assert path.parent == tmp_path / "naunet"
+
+    data = chemistrydata._load_sources()
+    assert path.exists()
+    assert data == chemistrydata._read_sources()
+    assert path.read_bytes().startswith(chemistrydata._cache_key() + b"\n")
+
+    # the cache is used only if it is created from the same version and files
+    key = chemistrydata._cache_key()
+    cached = pickle.loads(pickle.dumps(data))
+    cached["rate12_binding_energy"]["CO"] = 0.0
+    write_cache(path, key, cached)
+    assert chemistrydata._load_sources()["rate12_binding_energy"]["CO"] == 0.0
+
+    write_cache(path, b"0" * len(key), cached)
+    assert chemistrydata._load_sources()["rate12_binding_energy"]["CO"] == 1150.0
+
+    # the data are not unpickled if they do not match the checksum
+    write_cache(path, key, cached, checksum=b"0" * 64)
+    loaded = []
+    with monkeypatch.context() as m:
+        m.setattr(pickle, "loads", loaded.append)
+        assert chemistrydata._load_sources() == data
+    assert not loaded
+
+    # a broken cache is regenerated
+    path.write_bytes(b"broken")
+    assert chemistrydata._load_sources() == data
@@ -1,5 +1,5 @@
 from typing import OrderedDict
-from naunet.component import Component, VariableType as vt
+from naunet.component import Component, SymbolTable, VariableType as vt
 
 
 class Child(Component):
@@ -20,3 +20,68 @@ def test_child():
     deriveds = OrderedDict()
     deriveds["gdens"] = "y[GRAIN0]"
     child.deriveds == deriveds
+
+
+def test_shared_symbols():
+    child1 = Child()
+    child2 = Child()
+    assert child1._symbols is child2._symbols
+
+    child2.register("density", ("nH", 1.0, vt.constant), force_overwrite=True)
+    assert child1._symbols is not child2._symbols
+    assert child1.params == {"nH": None}
+    assert child2.constants == {"nH": 1.0, "eb_h2d": 1.21e3}
+    assert list(vars(child2.symbols)) == ["density", "eb_h2d", "grain_density"]
+
+    child2.unregister("eb_h2d")
+    assert child2.constants == {"nH": 1.0}
+    assert child1.constants == {"eb_h2d": 1.21e3}
+
+    child3 = Child()
+    child3.register("density", ("nH", 1.0, vt.constant), force_overwrite=True)
+    child3.unregister("eb_h2d")
+    assert child3._symbols is child2._symbols
+
+
+def test_bounded_transitions(monkeypatch):
+    monkeypatch.setattr(SymbolTable, "cache_size", 8)
+    monkeypatch.setattr(SymbolTable, "_transitions", SymbolTable._transitions.copy())
+
+    # e.g. the variables of many KROME headers
+    for i in range(20):
+        Child().register("foo", ("foo", f"{i} * Tgas", vt.derived))
+    assert len(SymbolTable._transitions) == 8
+
+    # the recently used tables are still shared
+    child1, child2 = Child(), Child()
+    assert child1._symbols is child2._symbols
+    child1.register("foo", ("foo", "19 * Tgas", vt.derived))
+    child2.register("foo", ("foo", "19 * Tgas", vt.derived))
+    assert child1._symbols is child2._symbols
+
+
+def test_symbol_copies():
+    child = Child()
+    assert type(child.params) is dict
+    assert isinstance(child.deriveds, OrderedDict)
+
+    # the shared tables are not changed by the returned values
+    child.params["nH"] = 1.0
+    child.constants.clear()
+    child.symbols.density = None
+    other = Child()
+    assert other.params == {"nH": None}
+    assert other.constants == {"eb_h2d": 1.21e3}
+    assert other.symbols.density.symbol == "nH"
+
+    child.register("radius", ("rG", 1e-5, vt.param))
+    assert child.symbols.radius.symbol == "rG"
+    assert child.params == {"nH": None, "rG": 1e-5}
+    assert list(other.params) == ["nH"]
+
+
+def test_pickle_symbols():
+    import pickle
+
+    child = pickle.loads(pickle.dumps(Child()))
+    assert child._symbols is Child()._symbols
@@ -8,7 +8,14 @@ from naunet.grains.grain import Grain
 from naunet.reactions.reaction import Reaction
 from naunet.reactiontype import ReactionType
 from naunet.reactions.kidareaction import KIDAReaction
-from naunet.network import Network, define_grain, supported_grain_model
+from naunet.reactions.uclchemreaction import UCLCHEMReaction
+from naunet.network import (
+    Network,
+    _can_read_in_worker,
+    define_grain,
+    supported_grain_model,
+    supported_reaction_class,
+)
 
 GITHUB_ACTIONS = os.getenv("GITHUB_ACTIONS") == "true"
 
@@ -194,11 +201,181 @@ def test_init_network_with_file(datadir):
     )
 
 
+def test_init_network_parallel(datadir, monkeypatch):
+    # a class defined here cannot be pickled, so its file is read serially
+    class LocalKIDAReaction(KIDAReaction):
+        __slots__ = ()
+        format = "localkida"
+
+    monkeypatch.setitem(supported_reaction_class, "localkida", LocalKIDAReaction)
+    assert _can_read_in_worker(KIDAReaction)
+    assert not _can_read_in_worker(LocalKIDAReaction)
+    # the tables of formats without a bulk reader only hold the lines
+    assert not _can_read_in_worker(UCLCHEMReaction)
+
+    kwargs = dict(
+        filelist=[
+            datadir / "duplicate.kida",
+            datadir / "primordial.krome",
+            datadir / "minimal.ucl",
+            datadir / "minimal.kida",
+            datadir / "multiduplicate.kida",
+        ],
+        fileformats=["kida", "krome", "uclchem", "kida", "localkida"],
+        allowed_species=["C", "CH", "H", "C2", "H+", "H-", "H2", "E", "e-"],
+    )
+    network = Network(**kwargs, workers=1)
+    parallel = Network(**kwargs, workers=2)
+
+    assert parallel._skipped_reactions
+    assert any(isinstance(r, LocalKIDAReaction) for r in parallel.reaction_list)
+    for reactions in ["reaction_list", "_skipped_reactions"]:
+        expected = getattr(network, reactions)
+        result = getattr(parallel, reactions)
+        assert [r.key for r in result] == [r.key for r in expected]
+        assert [r.source for r in result] == [r.source for r in expected]
+    assert parallel.reactants == network.reactants
+    assert parallel.products == network.products
+
+
+def test_allowed_species(example_network_from_reaction_list, example_reaction1):
+    network = example_network_from_reaction_list
+    network.add_reaction(example_reaction1)
+
+    network.allowed_species = ["H", "H+", "H2", "e-", "He", "He+"]
+    assert network.where_species("He") == [2]
+    assert [len(r.reactants) for r in network.reaction_list] == [1, 2, 1]
+    assert len(network._skipped_reactions) == 1
+    assert Species("C") not in network.products
+    assert Species("CH") not in network.reactants
+
+    # skipped reactions are added back when they are allowed
+    network.allowed_species = []
+    assert len(network.reaction_list) == 4
+    assert network._skipped_reactions == []
+    assert Species("CH") in network.reactants
+
+    with pytest.raises(RuntimeError):
+        Network(allowed_species=["H"], required_species=["He"])
+
+
+def test_network_element_context(datadir):
+    Species.reset()
+    network = Network(
+        filelist=datadir / "minimal.kida",
+        fileformats="kida",
+        elements=["H", "He", "C", "O", "e"],
+        pseudo_elements=["CR", "CRP", "Photon"],
+    )
+    assert Species.known_elements() == Species.default_elements
+    assert network.element_context.elements == ["H", "He", "C", "O", "e"]
+    assert network.where_species("C2") == [0, 1]
+
+    # the known elements of a network are kept while others are parsed
+    other = Network(elements=["H", "N"])
+    network.add_reaction_from_file(datadir / "minimal.kida", "kida")
+    assert other.element_context.elements == ["H", "N"]
+    Species.reset()
+
+
+def test_composition(example_network_from_reaction_list, example_reaction1):
+    np = pytest.importorskip("numpy")
+    network = example_network_from_reaction_list
+    composition = network.composition
+    assert network.composition is composition
+    assert composition.species == network.species
+    assert [composition.species[row] for row, _ in composition.column("H")] == [
+        s for s in network.species if "H" in s.element_count
+    ]
+
+    # conservation of elements in the reactions
+    for reac in network.reaction_list:
+        rows = [composition.species_index[s] for s in reac.reactants + reac.products]
+        stoich = np.zeros(len(composition.species))
+        np.add.at(stoich, rows[: len(reac.reactants)], -1)
+        np.add.at(stoich, rows[len(reac.reactants) :], 1)
+        conserved = stoich @ composition.matrix
+        assert not np.any(np.delete(conserved, composition.element_index["e"]))
+
+    network.add_reaction(example_reaction1)
+    assert network.composition is not composition
+    assert Species("He") in network.composition.species_index
+
+
+def test_cached_species(example_network_from_reaction_list, example_reaction1):
+    network = example_network_from_reaction_list
+    species = network.species
+    assert network.species == species
+    assert network.species is not species
+    assert network._sort_species()[0] is network._sort_species()[0]
+    assert dict(network.species_index) == {s: i for i, s in enumerate(species)}
+
+    network.add_reaction(example_reaction1)
+    assert Species("He") in network.species_index
+    network.required_species = ["CO"]
+    assert network.species[network.species_index[Species("CO")]] == Species("CO")
+
+
+def test_remove_reaction(example_network_from_reaction_list, example_reaction_list):
+    network = example_network_from_reaction_list
+    network.add_reaction(example_reaction_list[0])
+
+    removed = network.remove_reaction({0, 3})
+    assert removed == [example_reaction_list[0]] * 2
+    assert network.reaction_list == example_reaction_list[1:]
+    # the species only in the removed reactions are dropped
+    assert network.reactants == {Species("H2"), Species("CH"), Species("e-")}
+    assert Species("H+") not in network.products
+    assert Species("H+") not in network.species
+
+    assert network.remove_reaction([False, True]) == [example_reaction_list[2]]
+    assert network.remove_reaction(lambda r: Species("C") in r) == [
+        example_reaction_list[1]
+    ]
+    assert network.reaction_list == []
+    assert network.reactants == set()
+
+    network = Network(example_reaction_list)
+    assert network.remove_reaction(example_reaction_list[1:]) == (
+        example_reaction_list[1:]
+    )
+    assert network.remove_reaction(example_reaction_list[0]) == (
+        example_reaction_list[:1]
+    )
+
+    with pytest.raises(ValueError):
+        network.remove_reaction([True])
+    with pytest.raises(TypeError):
+        network.remove_reaction("H")
+
+
 def test_find_reaction(example_network_from_reaction_list, example_reaction_list):
     network = example_network_from_reaction_list
     assert network.where_reaction(example_reaction_list[0]) == [0]
 
 
+def test_find_reaction_indexed(
+    example_network_from_reaction_list, example_reaction_list, example_reaction1
+):
+    network = example_network_from_reaction_list
+    assert example_reaction_list[2] in network
+    assert example_reaction1 not in network
+
+    # the indices follow the changes of the reactions
+    network.add_reaction(example_reaction1)
+    network.add_reaction(example_reaction_list[0])
+    assert example_reaction1 in network
+    assert network.where_reaction(example_reaction_list[0]) == [0, 4]
+    assert network.where_reaction(example_reaction1, mode="kida") == [3]
+
+    network.remove_reaction(0)
+    assert network.where_reaction(example_reaction_list[0]) == [3]
+    assert network.where_reaction(example_reaction1, mode="kida") == [2]
+    assert network.where_reaction(Reaction(["He"], ["He+", "e-"]), mode="kida") == []
+    network.reindex()
+    assert network.where_reaction(example_reaction1, mode="kida") == [2]
+
+
 def test_find_species(example_network_from_reaction_list):
     network = example_network_from_reaction_list
     assert network.where_species(species="H2", mode="reactant") == [1, 2]
@@ -207,6 +384,33 @@ def test_find_species(example_network_from_reaction_list):
     assert network.where_species(species="H") == [0, 1, 2]
 
 
+def test_find_species_revision(example_network_from_reaction_list, example_reaction1):
+    network = example_network_from_reaction_list
+    assert network.where_species(species="H") == [0, 1, 2]
+
+    # the indices follow the added and removed reactions
+    network.add_reaction(example_reaction1)
+    assert network.where_species(species="e-", mode="product") == [0, 2, 3]
+    network.remove_reaction(0)
+    assert network.where_species(species="H") == [0, 1]
+    assert network.where_species(species="e-") == [1, 2]
+
+    source, sink = network.find_source_sink()
+    assert source == {Species("CH"), Species("He")}
+    assert sink == {Species("C"), Species("H"), Species("He+")}
+
+    # a new list of the same length is indexed again
+    network.reaction_list = network.reaction_list[::-1]
+    assert network.where_species(species="e-") == [0, 1]
+    assert network.where_species(species="H") == [1, 2]
+
+    # the added reactions extend the index instead of rebuilding it
+    byreactant, _ = network._index_species()
+    network.add_reaction(example_reaction1)
+    assert network._index_species()[0] is byreactant
+    assert network.where_species(species="He", mode="reactant") == [0, 3]
+
+
 @pytest.mark.slow
 def test_init_network_from_kida(datadir):
     network = Network()
@@ -1,5 +1,15 @@
+import pickle
+import time
+from copy import copy
+from concurrent.futures import ThreadPoolExecutor
 import pytest
-from naunet.species import Species
+from naunet import chemistrydata
+from naunet.species import (
+    ElementContext,
+    Species,
+    top_abundant_species,
+    top_abundant_species_array,
+)
 
 
 def test_known_elements_pseudoelements():
@@ -143,6 +153,31 @@ def test_enthalpy():
     assert Species("#CH").enthalpy == 592.5
 
 
+def test_update_enthalpy():
+    Species.reset()
+    species = Species("#H2O")
+    assert species.enthalpy == -238.9
+    chemistrydata.update_enthalpy({"#H2O": -200.0})
+    assert species.enthalpy == -200.0
+    chemistrydata.user_enthalpy.clear()
+
+
+def test_update_binding_energy_photon_yield():
+    Species.reset()
+    species = Species("#CO")
+    assert species.gasname == "CO"
+    assert species.eb == 1150.0
+    assert species.photon_yield == 0.0
+    chemistrydata.update_binding_energy({"#CO": 1300.0})
+    chemistrydata.update_photon_yield({"#CO": 1e-3})
+    assert species.eb == 1300.0
+    assert species.photon_yield == 1e-3
+    species.binding_energy = 1000.0
+    assert species.eb == 1000.0
+    chemistrydata.user_binding_energy.clear()
+    chemistrydata.user_photon_yield.clear()
+
+
 @pytest.mark.parametrize(
     "name1, gsym1, surf1, buik1, name2, gsym2, surf2, buik2",
     [
@@ -162,3 +197,208 @@ def test_eq(name1, gsym1, surf1, buik1, name2, gsym2, surf2, buik2):
     Species.add_known_elements(["Fake"])
     assert [Species("Fake"), spec1].index(spec2) == 1
     Species.reset()
+
+
+def test_intern():
+    Species.reset()
+    spec = Species.intern("H2O")
+    assert Species.intern("H2O") is spec
+    assert Species.intern("GH2O", surface_prefix="G") is not spec
+    assert Species.intern("GH2O", surface_prefix="G") == Species("#H2O")
+
+    # interned species are shared and read-only, their copies are not
+    with pytest.raises(AttributeError):
+        spec.alias = "Water"
+    assert spec.alias == "H2OI"
+    water = copy(spec)
+    water.alias = "Water"
+    assert water.alias == "Water" and water == spec
+    assert Species.intern("H2O").alias == "H2OI"
+    with pytest.raises(AttributeError):
+        Species.intern("#CO").binding_energy = 1000.0
+
+    # changing the known elements drops the interned species
+    Species.add_known_elements(["13C"])
+    assert Species.intern("H2O") is not spec
+    assert Species.intern("H213CO").element_count.get("13C") == 1
+
+    Species.set_known_elements(["H", "HE", "E"])
+    Species._replacement = {"HE": "He"}
+    assert Species.intern("HEH").name == "HeH"
+    Species.set_replacement({})
+    assert Species.intern("HEH").name == "HEH"
+    Species.reset()
+
+
+def test_from_names():
+    Species.reset()
+    names = ["H2O", "#CO", "H2O", "GRAIN0", "e-"]
+    species = Species.from_names(names)
+    assert [s.name for s in species] == names
+    assert species[0] is species[2] is Species.intern("H2O")
+
+    species = Species.from_names(["GCO", "GH2O"], surface_prefix="G")
+    assert species == [Species("#CO"), Species("#H2O")]
+
+    context = ElementContext(["H", "HE", "C", "O"], [], {"HE": "He"})
+    names = [f"C{i}H{j}" for i in range(1, 11) for j in range(1, 11)] + ["HEH"]
+    serial = Species.from_names(names, context=context)
+    context = ElementContext(["H", "HE", "C", "O"], [], {"HE": "He"})
+    parallel = Species.from_names(names, context=context, processes=2)
+    assert [s.name for s in parallel] == [s.name for s in serial]
+    assert [s.element_count for s in parallel] == [s.element_count for s in serial]
+    assert parallel[-1] is Species.intern("HEH", context=context)
+    assert parallel[-1]._context is context
+    Species.reset()
+
+
+def test_tokenizer():
+    Species.reset()
+    assert Species("SiS").element_count == {"Si": 1, "S": 1}
+    assert Species("HeH+").element_count == {"He": 1, "H": 1}
+    assert Species("c-C3H2").element_count == {"C": 3, "H": 2}
+    context = ElementContext.current()
+    assert context.tokenizer(("GRAIN", "#")) is context.tokenizer(("GRAIN", "#"))
+
+    Species.add_known_elements(["13C"])
+    assert Species("H213CO").element_count == {"H": 2, "13C": 1, "O": 1}
+    Species.reset()
+
+
+def test_element_context():
+    Species.reset()
+    context = ElementContext(["H", "HE", "E"], ["CR"], {"E": "e-", "HE": "He"})
+    with context.activate():
+        assert ElementContext.current() is context
+        assert Species.known_elements() == ["H", "HE", "E"]
+        assert Species("HEH+").name == "HeH+"
+        assert Species.intern("HEH") is Species.intern("HEH")
+    assert ElementContext.current() is not context
+    assert Species("HeH").name == "HeH"
+    assert Species("HEH", context=ElementContext(["H", "HE"])).alias == "HeHI"
+    assert Species.intern("HEH", context=context) is not Species.intern("HeH")
+
+    # the contexts are independent in threads
+    def parse(elements):
+        with ElementContext(elements).activate():
+            return [Species(f"{elements[0]}{n}").element_count for n in range(100)]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        counts = list(executor.map(parse, [["H", "O"], ["C", "N"]] * 4))
+    assert all(c[1] == {elements[0]: 1} for c, elements in zip(counts, ["H", "C"] * 4))
+
+    # copies keep the parsed state and context of the original species
+    spec = Species("HEH+", context=context)
+    assert copy(spec) == spec
+    assert copy(spec).element_count == {"H": 1, "He": 1}
+    assert copy(spec)._context is context
+
+    # interned species and patterns are not pickled
+    context = pickle.loads(pickle.dumps(context))
+    assert Species("HEH", context=context).name == "HeH"
+    Species.reset()
+
+
+def test_element_context_in_place():
+    Species.reset()
+    Species.set_known_elements(["H", "HE", "E"])
+    spec = Species.intern("HEH")
+    assert spec.name == "HEH"
+
+    # in-place changes drop the cached tokenizers, aliases and interned species
+    Species._replacement["HE"] = "He"
+    assert Species("HEH").name == "HeH"
+    assert Species.intern("HEH") is not spec
+    assert Species.intern("HEH").name == "HeH"
+    Species._known_elements.remove("HE")
+    assert Species("HEH").element_count == {"H": 2, "E": 1}
+
+    context = ElementContext(["H", "HE"])
+    assert Species("HEH", context=context).name == "HEH"
+    context.replacement["HE"] = "He"
+    assert Species("HEH", context=context).name == "HeH"
+    Species.reset()
+
+
+def test_identity():
+    Species.reset()
+    assert hash(Species("E")) == hash(Species("e-"))
+    assert Species("GRAIN0") == Species("GRAIN")
+    assert hash(Species("GRAIN0")) == hash(Species("GRAIN"))
+    assert Species("GRAIN0") != Species("GRAIN-")
+    assert Species("#CO") != Species("CO")
+    assert Species("He++").charge == 2
+    with pytest.raises(AttributeError):
+        Species("H").undefined = 1
+
+
+@pytest.mark.slow
+def test_benchmark_species_set():
+    Species.reset()
+    names = [f"C{i}H{j}" for i in range(1, 101) for j in range(1, 101)]
+    species = [Species(n) for n in names]
+    others = [Species(n) for n in names[::2]]
+
+    start = time.perf_counter()
+    for _ in range(10):
+        spset, otherset = set(species), set(others)
+        union = spset | otherset
+        diff = spset - otherset
+        found = [s for s in species if s in otherset]
+    elapsed = time.perf_counter() - start
+
+    assert len(union) == 10000
+    assert len(diff) == len(found) == 5000
+    # the hashes are cached, about 0.05s for the set operations above
+    assert elapsed < 1.0
+    Species.reset()
+
+
+def test_top_abundant_species_array():
+    np = pytest.importorskip("numpy")
+    Species.reset()
+    species = [Species(s) for s in ["H", "H2", "CO", "H2O", "CH4", "e-", "#CO"]]
+    rng = np.random.default_rng(0)
+    abundances = rng.random((20, len(species)))
+
+    for element, rank in [(None, 3), ("C", 2), ("H", -1), ("O", 10), (None, -2)]:
+        indices, values = top_abundant_species_array(
+            species, abundances, element=element, rank=rank
+        )
+        for cell, abund in enumerate(abundances):
+            expected = top_abundant_species(species, list(abund), element, rank)
+            assert [species[i] for i in indices[cell]] == [sp for sp, _ in expected]
+            assert list(values[cell]) == [ab for _, ab in expected]
+
+    indices, values = top_abundant_species_array(species, abundances[0], rank=1)
+    assert indices.shape == values.shape == (1,)
+
+    # no species are left, as in top_abundant_species
+    for rank in [0, -len(species)]:
+        with pytest.raises(RuntimeError):
+            top_abundant_species(species, list(abundances[0]), rank=rank)
+        with pytest.raises(RuntimeError):
+            top_abundant_species_array(species, abundances, rank=rank)
+
+    # tied abundances are ranked in the order of the species list
+    tied = np.zeros((3, len(species)))
+    tied[:, [2, 4]] = 1.0
+    for element, rank in [(None, 4), ("H", 2), ("C", 1)]:
+        indices, values = top_abundant_species_array(species, tied, element, rank)
+        expected = top_abundant_species(species, list(tied[0]), element, rank)
+        for cell in range(len(tied)):
+            assert [species[i] for i in indices[cell]] == [sp for sp, _ in expected]
+            assert list(values[cell]) == [ab for _, ab in expected]
+
+    # equal species with different names do not share the composition
+    for name, element in [("E", "E"), ("e-", "e")]:
+        named = [Species(name), Species("H")]
+        expected = top_abundant_species(named, [1.0, 2.0], element, 1)
+        indices, _ = top_abundant_species_array(named, [1.0, 2.0], element, 1)
+        assert [named[i] for i in indices] == [sp for sp, _ in expected]
+
+    with pytest.raises(RuntimeError):
+        top_abundant_species_array(species, abundances, element="N")
+    with pytest.raises(ValueError):
+        top_abundant_species_array(species[1:], abundances)
+    Species.reset()